@@ -0,0 +1,48 @@
+"""Shared model provider clients.
+
+The coach and the orchestrator talk to the same APIs. Sharing one client per
+provider lets them reuse its pooled keep-alive connections instead of each
+opening (and TLS-handshaking) their own. SDKs are imported on first use, so
+an unused provider is never loaded.
+"""
+
+from config.settings import ANTHROPIC_API_KEY, DEEPSEEK_API_KEY
+
+DEEPSEEK_BASE_URL = "https://api.deepseek.com"
+
+# Fail fast when the API is unreachable, but leave room for long generations
+# (the SDK defaults to 10 minutes)
+TIMEOUT_SECONDS = 60.0
+CONNECT_TIMEOUT_SECONDS = 5.0
+
+_async_anthropic_client = None
+_async_deepseek_client = None
+
+
+def get_async_anthropic_client():
+    """Get the shared AsyncAnthropic client (created on first use)."""
+    global _async_anthropic_client
+    if _async_anthropic_client is None:
+        if not ANTHROPIC_API_KEY:
+            raise ValueError("ANTHROPIC_API_KEY not set")
+        import anthropic
+        _async_anthropic_client = anthropic.AsyncAnthropic(
+            api_key=ANTHROPIC_API_KEY,
+            timeout=anthropic.Timeout(TIMEOUT_SECONDS, connect=CONNECT_TIMEOUT_SECONDS),
+        )
+    return _async_anthropic_client
+
+
+def get_async_deepseek_client():
+    """Get the shared async DeepSeek client (OpenAI-compatible, created on first use)."""
+    global _async_deepseek_client
+    if _async_deepseek_client is None:
+        if not DEEPSEEK_API_KEY:
+            raise ValueError("DEEPSEEK_API_KEY not set")
+        import openai
+        _async_deepseek_client = openai.AsyncOpenAI(
+            api_key=DEEPSEEK_API_KEY,
+            base_url=DEEPSEEK_BASE_URL,
+            timeout=openai.Timeout(TIMEOUT_SECONDS, connect=CONNECT_TIMEOUT_SECONDS),
+        )
+    return _async_deepseek_client
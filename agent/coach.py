@@ -1,18 +1,29 @@
-import json
+import asyncio
 import logging
 import re
-
-from anthropic import Anthropic
-from openai import OpenAI
+from dataclasses import dataclass, field
+from datetime import datetime
 
 from config.settings import (
-    ANTHROPIC_API_KEY, DEEPSEEK_API_KEY, COACH_PROVIDER,
-    USER_NAME, USER_PRONOUNS, GUILT_LEVEL
+    COACH_PROVIDER, USER_NAME, USER_PRONOUNS, GUILT_LEVEL, SPARK_MAX_HISTORY,
+)
+from agent import jsonutil
+from agent.clients import get_async_anthropic_client, get_async_deepseek_client
+from agent.tools import (
+    READ_TOOL, WRITE_TOOL, ANTHROPIC_TOOL_DEFINITIONS, OPENAI_TOOL_DEFINITIONS,
+    execute_tool, read_think_os,
 )
-from agent.tools import TOOL_DEFINITIONS, execute_tool, read_think_os
 
 logger = logging.getLogger(__name__)
 
+# [HH:MM] timestamps the model sometimes copies from history
+_TS_RE = re.compile(r'\[\d{1,2}:\d{2}\]\s*')
+
+# Words suggesting the model claims to have written to Think OS
+_ACK_WORDS = ("updated", "noted", "saved", "recorded", "logged")
+
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
 # Model configs per provider
 COACH_CONFIGS = {
     "anthropic": {"model": "claude-3-5-haiku-20241022", "style_boost": ""},
@@ -41,19 +52,40 @@ When user says "ok" / "on it" → ask "how long?" or "lmk when done", don't imme
 }
 
 
-def convert_tools_to_openai(anthropic_tools: list) -> list:
-    """Convert Anthropic tool definitions to OpenAI format."""
-    openai_tools = []
-    for tool in anthropic_tools:
-        openai_tools.append({
-            "type": "function",
-            "function": {
-                "name": tool["name"],
-                "description": tool["description"],
-                "parameters": tool["input_schema"],
-            }
-        })
-    return openai_tools
+# Anthropic prompt caching: everything up to a block marked with this is
+# cached server-side and billed at ~10% on subsequent requests
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _with_cache_breakpoint(messages: list) -> list:
+    """Return a copy of messages with a cache breakpoint on the last user turn.
+
+    The conversation so far is then reusable by the next request in the
+    tool loop and by the next chat turn. History itself is left untouched.
+    """
+    if not messages or messages[-1]["role"] != "user":
+        return messages
+    last = messages[-1]
+    content = last["content"]
+    if isinstance(content, str):
+        content = [{"type": "text", "text": content, "cache_control": CACHE_CONTROL}]
+    else:
+        content = [*content[:-1], {**content[-1], "cache_control": CACHE_CONTROL}]
+    return [*messages[:-1], {**last, "content": content}]
+
+
+def _short_json(result: dict, limit: int = 200) -> str:
+    """Render a tool result for logging without serializing file contents."""
+    if result.get("type") == "file":
+        return jsonutil.dumps({"success": result["success"], "chars": len(result["content"])})
+    if "results" in result:
+        return jsonutil.dumps({path: r["success"] for path, r in result["results"].items()})[:limit]
+    return jsonutil.dumps(result)[:limit]
+
+
+SUMMARY_PROMPT = """Summarize this conversation between a user and their coach Spark.
+Summarize concisely as bullet facts: plans, commitments, deadlines, feelings, what Spark already said.
+If a previous summary is given, merge it in. Max 10 bullets."""
 
 # System prompt is loaded from Think OS: memory/spark-protocol.md
 # Fallback prompt if protocol file not found
@@ -62,6 +94,13 @@ Read memory/spark/protocol.md to understand how to behave.
 If that file doesn't exist, be helpful and concise."""
 
 
+@dataclass(slots=True)
+class _Turn:
+    """State for one chat turn, kept off the shared Coach instance."""
+    seen_reads: set[tuple[str, str]] = field(default_factory=set)
+    wrote: bool = False
+
+
 class Coach:
     """Claude-powered coach agent. Loads behavior from Think OS files."""
 
@@ -70,265 +109,379 @@ class Coach:
         self.config = COACH_CONFIGS.get(self.provider, COACH_CONFIGS["anthropic"])
         self.max_tokens = 1024
 
-        # Initialize clients based on provider
-        self.anthropic_client = Anthropic(api_key=ANTHROPIC_API_KEY) if ANTHROPIC_API_KEY else None
-        self.deepseek_client = OpenAI(
-            api_key=DEEPSEEK_API_KEY,
-            base_url="https://api.deepseek.com"
-        ) if DEEPSEEK_API_KEY else None
-
-        # Validate we have the right client
-        if self.provider == "deepseek" and not self.deepseek_client:
-            raise ValueError("DEEPSEEK_API_KEY not set")
-        elif self.provider == "anthropic" and not self.anthropic_client:
-            raise ValueError("ANTHROPIC_API_KEY not set")
+        # Only the configured provider's (shared) client is created, so the
+        # other SDK is never loaded. Raises ValueError if its key is missing.
+        self.anthropic_client = None
+        self.deepseek_client = None
+        if self.provider == "deepseek":
+            self.deepseek_client = get_async_deepseek_client()
+        else:
+            self.anthropic_client = get_async_anthropic_client()
 
-        logger.info(f"Coach provider: {self.provider}, model: {self.config['model']}")
+        logger.info("Coach provider: %s, model: %s", self.provider, self.config["model"])
 
-        self._system_prompt: str | None = None
+        self._system_prompt: list[dict] | None = None
+        self._system_prompt_key: tuple | None = None
         self.history: list[dict] = []
         self._history_date: str | None = None  # Track which day's history this is
 
-    async def _load_system_prompt(self) -> str:
-        """Load system prompt from Think OS files.
+        # Summary of the oldest messages (see _schedule_summary). They stay in
+        # history for the orchestrator; only the coach's window skips them.
+        self.rolling_summary: str | None = None
+        self._summarized = 0  # leading history messages covered by rolling_summary
+        self._summary_task: asyncio.Task | None = None
+
+    async def _load_system_prompt(self) -> list[dict]:
+        """Load system prompt from Think OS files as Anthropic text blocks.
 
-        Protocol and profile are cached. Learned preferences reload every time.
+        All three files are re-read on every call (storage caches unchanged
+        files), so edits take effect immediately. The assembled prompt is
+        reused as long as none of them changed.
+
+        Static content (user info, protocol, profile, style boost) comes first
+        and carries the cache breakpoint; learned preferences change more
+        often and stay in a trailing uncached block.
         """
-        # Load static parts once
-        if self._system_prompt is None:
-            parts = []
-
-            # 0. User config (from .env)
-            user_info = []
-            if USER_NAME:
-                user_info.append(f"Name: {USER_NAME}")
-            if USER_PRONOUNS:
-                user_info.append(f"Pronouns: {USER_PRONOUNS}")
-            if GUILT_LEVEL:
-                guilt_note = {"chill": "go easy on them", "medium": "normal guilt trips", "savage": "be ruthless"}.get(GUILT_LEVEL, GUILT_LEVEL)
-                user_info.append(f"Guilt level: {guilt_note}")
-            if user_info:
-                parts.append(f"# User\n{', '.join(user_info)}")
-
-            # 1. Protocol (defines behavior) - static
-            result = await read_think_os("memory/spark/protocol.md")
-            if result["success"]:
-                parts.append(result["content"])
-            else:
-                parts.append(FALLBACK_SYSTEM_PROMPT)
-                logger.warning("spark-protocol.md not found, using fallback")
+        protocol, profile, learned = await asyncio.gather(
+            read_think_os("memory/spark/protocol.md"),
+            read_think_os("memory/profile.md"),
+            read_think_os("memory/spark/learned.md"),
+        )
+
+        # Unchanged files come back as the same cached strings, so this
+        # comparison is an identity check in the common case
+        key = (protocol.get("content"), profile.get("content"), learned.get("content"))
+        if self._system_prompt is not None and key == self._system_prompt_key:
+            return self._system_prompt
+
+        parts = []
+
+        # 0. User config (from .env)
+        user_info = []
+        if USER_NAME:
+            user_info.append(f"Name: {USER_NAME}")
+        if USER_PRONOUNS:
+            user_info.append(f"Pronouns: {USER_PRONOUNS}")
+        if GUILT_LEVEL:
+            guilt_note = {"chill": "go easy on them", "medium": "normal guilt trips", "savage": "be ruthless"}.get(GUILT_LEVEL, GUILT_LEVEL)
+            user_info.append(f"Guilt level: {guilt_note}")
+        if user_info:
+            parts.append(f"# User\n{', '.join(user_info)}")
+
+        # 1. Protocol (defines behavior)
+        if protocol["success"]:
+            parts.append(protocol["content"])
+        else:
+            parts.append(FALLBACK_SYSTEM_PROMPT)
+            logger.warning("spark-protocol.md not found, using fallback")
 
-            # 2. User profile (relationship context) - static
-            result = await read_think_os("memory/profile.md")
-            if result["success"]:
-                parts.append(f"\n---\n\n# User Profile\n\n{result['content']}")
+        # 2. User profile (relationship context)
+        if profile["success"]:
+            parts.append(f"\n---\n\n# User Profile\n\n{profile['content']}")
 
-            self._system_prompt = "\n".join(parts)
-            logger.info(f"Loaded base system prompt: {len(self._system_prompt)} chars")
+        static_prompt = "\n".join(parts)
 
-        # 3. Learned preferences - reload every time so learning takes effect immediately
-        full_prompt = self._system_prompt
-        result = await read_think_os("memory/spark/learned.md")
-        if result["success"]:
-            full_prompt += f"\n---\n\n# Learned Preferences\n\n{result['content']}"
+        # Add style_boost for this provider (e.g., DeepSeek-specific rules)
+        style_boost = self.config.get("style_boost", "")
+        if style_boost:
+            static_prompt += style_boost
+
+        blocks = [{"type": "text", "text": static_prompt, "cache_control": CACHE_CONTROL}]
 
-        return full_prompt
+        # 3. Learned preferences
+        if learned["success"]:
+            blocks.append({
+                "type": "text",
+                "text": f"\n---\n\n# Learned Preferences\n\n{learned['content']}",
+            })
+
+        self._system_prompt = blocks
+        self._system_prompt_key = key
+        logger.info("Loaded system prompt: %d chars", sum(len(b["text"]) for b in blocks))
+        return blocks
 
     def clear_history(self) -> None:
         """Clear conversation history."""
         self.history = []
         self._history_date = None
+        self.rolling_summary = None
+        self._summarized = 0
         logger.info("Conversation history cleared")
 
     def _check_daily_reset(self) -> None:
         """Reset history if it's a new day."""
-        from datetime import datetime
         today = datetime.now().strftime("%Y-%m-%d")
         if self._history_date != today:
             if self._history_date is not None:
-                logger.info(f"New day detected ({self._history_date} → {today}), clearing history")
+                logger.info("New day detected (%s → %s), clearing history", self._history_date, today)
             self.history = []
             self._history_date = today
+            self.rolling_summary = None
+            self._summarized = 0
 
-    async def chat(self, user_message: str) -> str:
-        """Process a user message and return the agent's response."""
-        from datetime import datetime
-
+    async def _start_turn(self, user_message: str) -> list[dict]:
+        """Record the user message and return the system prompt for this turn."""
         # Reset history if new day
         self._check_daily_reset()
 
-        # Load system prompt from Think OS (cached after first load)
+        # Load system prompt from Think OS (rebuilt only when files change)
         system_prompt = await self._load_system_prompt()
 
-        # Add style_boost for this provider (e.g., DeepSeek-specific rules)
-        style_boost = self.config.get("style_boost", "")
-        if style_boost:
-            system_prompt += style_boost
-
         # KV-cache optimization: time context goes in user message, not system prompt
         # This keeps system_prompt stable for caching (~10x cost reduction)
         now = datetime.now()
-        weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        time_context = f"[{now.strftime('%H:%M')} {weekdays[now.weekday()]} {now.strftime('%Y-%m-%d')}]"
+        time_context = f"[{now:%H:%M} {_WEEKDAYS[now.weekday()]} {now:%Y-%m-%d}]"
 
         # Add user message to history with timestamp
         self.history.append({"role": "user", "content": f"{time_context} {user_message}"})
 
+        # Fold old messages into the rolling summary before they fall out of the window
+        if len(self.history) - self._summarized > SPARK_MAX_HISTORY:
+            self._schedule_summary()
+
+        # Summary sits between the static prompt and learned prefs, with its
+        # own breakpoint so it stays cached until the next summarization
+        if self.rolling_summary:
+            system_prompt = [system_prompt[0], {
+                "type": "text",
+                "text": f"\n---\n\n# [Prior context summary]\n\n{self.rolling_summary}",
+                "cache_control": CACHE_CONTROL,
+            }, *system_prompt[1:]]
+
+        return system_prompt
+
+    async def chat(self, user_message: str) -> str:
+        """Process a user message and return the agent's response."""
+        system_prompt = await self._start_turn(user_message)
+        turn = _Turn()
+
         # Route to appropriate provider
         if self.provider == "deepseek":
-            return await self._chat_deepseek(system_prompt)
+            return await self._chat_deepseek(system_prompt, turn)
+        return await self._chat_anthropic(system_prompt, turn)
+
+    def _schedule_summary(self) -> None:
+        """Summarize the oldest half of the unsummarized history in the background.
+
+        On completion rolling_summary covers those messages too and the
+        coach's window skips them, unless history was cleared or reset in
+        the meantime.
+        """
+        if self._summary_task and not self._summary_task.done():
+            return
+
+        # Cut right before a user message so the window still starts with one
+        start = self._summarized
+        cut = start + (len(self.history) - start) // 2
+        while cut < len(self.history) and self.history[cut]["role"] != "user":
+            cut += 1
+        if cut >= len(self.history):
+            return
+
+        batch = self.history[start:cut]
+        self._summary_task = asyncio.create_task(self._summarize(start, batch))
+
+    async def _summarize(self, start: int, batch: list[dict]) -> None:
+        """Merge batch (history from index start on) into rolling_summary."""
+        lines = []
+        if self.rolling_summary:
+            lines.append(f"Previous summary:\n{self.rolling_summary}\n")
+        for m in batch:
+            speaker = "Spark" if m["role"] == "assistant" else "User"
+            lines.append(f"{speaker}: {m['content']}")
+        transcript = "\n".join(lines)
+
+        try:
+            if self.provider == "deepseek":
+                response = await self.deepseek_client.chat.completions.create(
+                    model=self.config["model"],
+                    max_tokens=200,
+                    temperature=0.2,
+                    messages=[
+                        {"role": "system", "content": SUMMARY_PROMPT},
+                        {"role": "user", "content": transcript},
+                    ],
+                )
+                summary = response.choices[0].message.content or ""
+            else:
+                response = await self.anthropic_client.messages.create(
+                    model=self.config["model"],
+                    max_tokens=200,
+                    system=SUMMARY_PROMPT,
+                    messages=[{"role": "user", "content": transcript}],
+                )
+                summary = "".join(b.text for b in response.content if hasattr(b, "text"))
+        except Exception as e:
+            logger.warning("History summarization failed: %s", e)
+            return
+
+        summary = summary.strip()
+        if not summary:
+            return
+
+        # History may have been cleared or reset while we were waiting
+        end = start + len(batch)
+        if (self._summarized != start or len(self.history) < end
+                or any(a is not b for a, b in zip(self.history[start:end], batch))):
+            logger.info("History changed during summarization, discarding summary")
+            return
+
+        self._summarized = end
+        self.rolling_summary = summary
+        logger.info("Summarized %d messages into rolling summary (%d chars)", len(batch), len(summary))
+
+    async def _run_tool(self, tool_name: str, tool_input: dict, turn: _Turn) -> dict:
+        """Execute a tool, deduplicating repeated reads within this turn.
+
+        The first result is already in the turn's messages, so a repeat read
+        gets a short pointer back to it instead of the full file again.
+        """
+        if tool_name != READ_TOOL:
+            # A write can change what the next read returns
+            if tool_name == WRITE_TOOL:
+                turn.wrote = True
+                turn.seen_reads.clear()
+            return await execute_tool(tool_name, tool_input)
+
+        key = (tool_name, jsonutil.dumps(tool_input, sort_keys=True))
+        if key in turn.seen_reads:
+            logger.info("Tool cache hit: %s(%s)", tool_name, key[1])
+            return {"success": True, "unchanged": True, "note": "Same as your earlier call with these arguments."}
+
+        result = await execute_tool(tool_name, tool_input)
+        if result["success"]:
+            turn.seen_reads.add(key)
+        return result
+
+    def _trim_history(self, messages: list[dict]) -> list[dict]:
+        """Return a copy of messages limited to the last SPARK_MAX_HISTORY.
+
+        Messages already covered by rolling_summary are left out. When the
+        window cuts into the conversation, leading non-user messages are
+        dropped so the request never starts mid-exchange.
+        """
+        messages = messages[self._summarized:]
+        if len(messages) <= SPARK_MAX_HISTORY:
+            return messages
+
+        window = messages[-SPARK_MAX_HISTORY:]
+        start = 0
+        while start < len(window) and window[start]["role"] != "user":
+            start += 1
+        logger.info("Trimmed history: %d -> %d messages", len(messages), len(window) - start)
+        return window[start:]
+
+    def _finalize_response(self, final_text: str, turn: _Turn) -> str:
+        """Clean up the model's final text and record it in history."""
+        # Strip any [HH:MM] timestamps the model might output (anywhere in text)
+        final_text = _TS_RE.sub('', final_text)
+
+        # Validate: if model claims to have written but didn't call tool
+        low = final_text.lower()
+        if any(word in low for word in _ACK_WORDS) and not turn.wrote:
+            logger.warning("Model claimed to write but didn't call write_think_os: %s", final_text[:100])
+
+        # Truncate chain-of-thought: if too many lines, keep last few
+        lines = [l for l in final_text.splitlines() if l.strip()]
+        if len(lines) > 6:
+            logger.info("Truncating verbose response: %d lines -> 4 lines", len(lines))
+            final_text = '\n'.join(lines[-4:])
+
+        if final_text.strip():
+            self.history.append({"role": "assistant", "content": f"[{datetime.now():%H:%M}] {final_text}"})
         else:
-            return await self._chat_anthropic(system_prompt)
+            logger.warning("Empty response, not saving to history")
+
+        return final_text if final_text.strip() else "hold on"
 
-    async def _chat_anthropic(self, system_prompt: str) -> str:
+    async def _chat_anthropic(self, system_prompt: list[dict], turn: _Turn) -> str:
         """Chat using Anthropic API."""
-        messages = list(self.history)
-        wrote_this_turn = False  # Track if write_think_os was called
+        messages = self._trim_history(self.history)
 
         while True:
-            logger.info(f"Calling Anthropic API... (history: {len(self.history)} messages)")
+            logger.info("Calling Anthropic API... (history: %d messages)", len(self.history))
 
-            response = self.anthropic_client.messages.create(
+            response = await self.anthropic_client.messages.create(
                 model=self.config["model"],
                 max_tokens=self.max_tokens,
                 system=system_prompt,
-                tools=TOOL_DEFINITIONS,
-                messages=messages,
+                tools=ANTHROPIC_TOOL_DEFINITIONS,
+                messages=_with_cache_breakpoint(messages),
             )
 
-            logger.info(f"Response stop_reason: {response.stop_reason}")
-
-            if response.stop_reason == "tool_use":
-                tool_results = []
-                assistant_content = response.content
+            logger.info("Response stop_reason: %s", response.stop_reason)
 
-                for block in response.content:
-                    if block.type == "tool_use":
-                        tool_name = block.name
-                        tool_input = block.input
-                        tool_use_id = block.id
+            if response.stop_reason != "tool_use":
+                final_text = "".join(block.text for block in response.content if hasattr(block, "text"))
+                return self._finalize_response(final_text, turn)
 
-                        logger.info(f"Tool call: {tool_name}({json.dumps(tool_input)})")
+            tool_results = []
+            for block in response.content:
+                if block.type == "tool_use":
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Tool call: %s(%s)", block.name, jsonutil.dumps(block.input))
 
-                        # Track write calls
-                        if tool_name == "write_think_os":
-                            wrote_this_turn = True
+                    result = await self._run_tool(block.name, block.input, turn)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Tool result: %s...", _short_json(result))
 
-                        result = await execute_tool(tool_name, tool_input)
-                        logger.info(f"Tool result: {json.dumps(result)[:200]}...")
-
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": tool_use_id,
-                            "content": json.dumps(result),
-                        })
+                    tool_results.append({
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": jsonutil.dumps(result),
+                    })
 
-                messages.append({"role": "assistant", "content": assistant_content})
-                messages.append({"role": "user", "content": tool_results})
+            messages.append({"role": "assistant", "content": response.content})
+            messages.append({"role": "user", "content": tool_results})
 
-            else:
-                final_text = ""
-                for block in response.content:
-                    if hasattr(block, "text"):
-                        final_text += block.text
-
-                # Strip any [HH:MM] timestamps the model might output (anywhere in text)
-                final_text = re.sub(r'\[\d{1,2}:\d{2}\]\s*', '', final_text)
-
-                # Validate: if model claims to have written but didn't call tool
-                acknowledgment_words = ["updated", "noted", "saved", "recorded", "logged"]
-                if any(word in final_text.lower() for word in acknowledgment_words) and not wrote_this_turn:
-                    logger.warning(f"Model claimed to write but didn't call write_think_os: {final_text[:100]}")
-
-                # Truncate chain-of-thought: if too many lines, keep last few
-                lines = [l for l in final_text.strip().split('\n') if l.strip()]
-                if len(lines) > 6:
-                    logger.info(f"Truncating verbose response: {len(lines)} lines -> 4 lines")
-                    final_text = '\n'.join(lines[-4:])
-
-                if final_text.strip():
-                    from datetime import datetime
-                    timestamp = datetime.now().strftime("%H:%M")
-                    self.history.append({"role": "assistant", "content": f"[{timestamp}] {final_text}"})
-                else:
-                    logger.warning("Empty response, not saving to history")
-
-                return final_text if final_text.strip() else "hold on"
-
-    async def _chat_deepseek(self, system_prompt: str) -> str:
+    async def _chat_deepseek(self, system_prompt: list[dict], turn: _Turn) -> str:
         """Chat using DeepSeek API (OpenAI-compatible)."""
         # Build messages with system prompt for OpenAI format
-        messages = [{"role": "system", "content": system_prompt}]
-        messages.extend(self.history)
-
-        openai_tools = convert_tools_to_openai(TOOL_DEFINITIONS)
-        wrote_this_turn = False  # Track if write_think_os was called
+        # (DeepSeek caches shared prefixes automatically, no markers needed)
+        messages = [{"role": "system", "content": "".join(b["text"] for b in system_prompt)}]
+        messages.extend(self._trim_history(self.history))
 
         while True:
-            logger.info(f"Calling DeepSeek API... (history: {len(self.history)} messages)")
+            logger.info("Calling DeepSeek API... (history: %d messages)", len(self.history))
 
-            response = self.deepseek_client.chat.completions.create(
+            response = await self.deepseek_client.chat.completions.create(
                 model=self.config["model"],
                 max_tokens=self.max_tokens,
                 messages=messages,
-                tools=openai_tools,
+                tools=OPENAI_TOOL_DEFINITIONS,
             )
 
             choice = response.choices[0]
-            logger.info(f"Response finish_reason: {choice.finish_reason}")
+            logger.info("Response finish_reason: %s", choice.finish_reason)
 
-            if choice.finish_reason == "tool_calls" and choice.message.tool_calls:
-                messages.append(choice.message)
+            if choice.finish_reason != "tool_calls" or not choice.message.tool_calls:
+                final_text = choice.message.content or ""
 
-                for tool_call in choice.message.tool_calls:
-                    tool_name = tool_call.function.name
-                    tool_input = json.loads(tool_call.function.arguments)
+                # Log raw response for debugging
+                logger.info("RAW COACH RESPONSE (%d chars):\n%s", len(final_text), final_text[:2000])
+                if len(final_text) > 2000:
+                    logger.info("... (truncated, total %d chars)", len(final_text))
 
-                    logger.info(f"Tool call: {tool_name}({json.dumps(tool_input)})")
+                return self._finalize_response(final_text, turn)
 
-                    # Track write calls
-                    if tool_name == "write_think_os":
-                        wrote_this_turn = True
+            messages.append(choice.message)
 
-                    result = await execute_tool(tool_name, tool_input)
-                    logger.info(f"Tool result: {json.dumps(result)[:200]}...")
+            for tool_call in choice.message.tool_calls:
+                tool_name = tool_call.function.name
+                tool_input = jsonutil.loads(tool_call.function.arguments or "{}")
 
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": json.dumps(result),
-                    })
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Tool call: %s(%s)", tool_name, jsonutil.dumps(tool_input))
 
-            else:
-                final_text = choice.message.content or ""
+                result = await self._run_tool(tool_name, tool_input, turn)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Tool result: %s...", _short_json(result))
 
-                # Log raw response for debugging
-                logger.info(f"RAW COACH RESPONSE ({len(final_text)} chars):\n{final_text[:2000]}")
-                if len(final_text) > 2000:
-                    logger.info(f"... (truncated, total {len(final_text)} chars)")
-
-                # Strip any [HH:MM] timestamps the model might output (anywhere in text)
-                final_text = re.sub(r'\[\d{1,2}:\d{2}\]\s*', '', final_text)
-
-                # Validate: if model claims to have written but didn't call tool
-                acknowledgment_words = ["updated", "noted", "saved", "recorded", "logged"]
-                if any(word in final_text.lower() for word in acknowledgment_words) and not wrote_this_turn:
-                    logger.warning(f"Model claimed to write but didn't call write_think_os: {final_text[:100]}")
-
-                # Truncate chain-of-thought: if too many lines, keep last few
-                lines = [l for l in final_text.strip().split('\n') if l.strip()]
-                if len(lines) > 6:
-                    logger.info(f"Truncating verbose response: {len(lines)} lines -> 4 lines")
-                    final_text = '\n'.join(lines[-4:])
-
-                if final_text.strip():
-                    from datetime import datetime
-                    timestamp = datetime.now().strftime("%H:%M")
-                    self.history.append({"role": "assistant", "content": f"[{timestamp}] {final_text}"})
-                else:
-                    logger.warning("Empty response, not saving to history")
-
-                return final_text if final_text.strip() else "hold on"
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "content": jsonutil.dumps(result),
+                })
 
 
 _coach = None
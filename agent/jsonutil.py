@@ -0,0 +1,32 @@
+"""JSON helpers - uses orjson when installed, stdlib json otherwise."""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize obj to a JSON string (UTF-8, non-ASCII kept as is).
+
+    Output is compact unless indent=True, which pretty-prints with 2 spaces.
+    """
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode()
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def loads(data: str | bytes):
+    """Parse a JSON string or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
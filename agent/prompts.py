@@ -1,6 +1,8 @@
 """Command prompts - Think OS session commands migrated from Claude Code."""
 
-COMMANDS = {
+from types import MappingProxyType
+
+COMMANDS = MappingProxyType({
     "startup": """Think OS session startup.
 
 1. **Read core context** (use your preloaded context, no need to read again):
@@ -119,12 +121,15 @@ Tips:
 
 Keep it brief and supportive.
 """,
-}
+})
+
+# Keys are lowercase so the common lookup needs no case folding
+assert all(name == name.lower() for name in COMMANDS)
 
 
 def get_command(name: str) -> str | None:
-    """Get a command prompt by name."""
-    return COMMANDS.get(name.lower())
+    """Get a command prompt by name (case-insensitive)."""
+    return COMMANDS.get(name) or COMMANDS.get(name.lower())
 
 
 def list_commands() -> list[str]:
@@ -1,11 +1,12 @@
 """Session state management - persists to Think OS."""
 
-import json
+import asyncio
 import logging
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, replace
 from pathlib import Path
 
+from agent import jsonutil
 from agent.storage import get_storage
 from config.settings import THINK_OS_PATH
 
@@ -14,12 +15,35 @@ logger = logging.getLogger(__name__)
 # Relative path within Think OS
 STATE_FILE_REL = "memory/spark/state.json"
 
+# update_state() only records the new state; it is written once this long
+# after the first of a burst of updates (or by flush_state() on shutdown)
+FLUSH_DELAY_SECONDS = 0.5
+
+
+# ISO datetime field -> its epoch-seconds twin in SessionState
+TIMESTAMP_FIELDS = {
+    "last_interaction": "last_interaction_ts",
+    "working_until": "working_until_ts",
+    "last_spark_message": "last_spark_ts",
+}
+
+
+_state_path: str | None = None
+
 
 def _get_state_path() -> str:
     """Get absolute path to state file in Think OS."""
-    if not THINK_OS_PATH:
-        raise ValueError("THINK_OS_PATH not configured")
-    return str(Path(THINK_OS_PATH) / STATE_FILE_REL)
+    global _state_path
+    if _state_path is None:
+        if not THINK_OS_PATH:
+            raise ValueError("THINK_OS_PATH not configured")
+        _state_path = str(Path(THINK_OS_PATH) / STATE_FILE_REL)
+    return _state_path
+
+
+def _iso_to_ts(value: str | None) -> float | None:
+    """Convert an ISO datetime string to epoch seconds (None stays None)."""
+    return datetime.fromisoformat(value).timestamp() if value else None
 
 
 @dataclass
@@ -33,25 +57,74 @@ class SessionState:
     # Context engineering improvements
     working_until: str | None = None  # ISO datetime - user's stated deadline (e.g., "30 min" from now)
     last_spark_message: str | None = None  # ISO datetime - when Spark last sent a message
-
+    # Epoch seconds of the ISO fields above, for cheap comparisons in the
+    # orchestrator tick. Always derived from the ISO strings, never saved,
+    # so an edit to state.json can't leave them stale.
+    last_interaction_ts: float | None = None
+    working_until_ts: float | None = None
+    last_spark_ts: float | None = None
+
+    # All fields are primitives, so they are packed directly rather than
+    # through dataclasses.asdict (which deep-copies). Keep in sync with fields.
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "last_interaction": self.last_interaction,
+            "unanswered_count": self.unanswered_count,
+            "stuck_on": self.stuck_on,
+            "current_focus": self.current_focus,
+            "last_checkin_summary": self.last_checkin_summary,
+            "working_until": self.working_until,
+            "last_spark_message": self.last_spark_message,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "SessionState":
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        timestamps = {ts_key: _iso_to_ts(data.get(iso_key)) for iso_key, ts_key in TIMESTAMP_FIELDS.items()}
+        return cls(
+            last_interaction=data.get("last_interaction"),
+            unanswered_count=data.get("unanswered_count", 0),
+            stuck_on=data.get("stuck_on"),
+            current_focus=data.get("current_focus"),
+            last_checkin_summary=data.get("last_checkin_summary"),
+            working_until=data.get("working_until"),
+            last_spark_message=data.get("last_spark_message"),
+            **timestamps,
+        )
+
+
+_pending_state: SessionState | None = None
+_flush_task: asyncio.Task | None = None
+_last_saved: str | None = None  # File content as last read or written
+# (content, parsed state) of the last load, so unchanged files aren't re-parsed
+_loaded: tuple[str, SessionState] | None = None
 
 
 async def load_state() -> SessionState:
-    """Load state from Think OS. Returns default state if not found."""
+    """Load state from Think OS. Returns default state if not found.
+
+    An update that hasn't been flushed yet takes precedence over the file.
+    """
+    global _last_saved, _loaded
+    if _pending_state is not None:
+        return replace(_pending_state)
+
     storage = get_storage()
     state_path = _get_state_path()
     try:
-        if await storage.exists(state_path):
-            content = await storage.read(state_path)
-            data = json.loads(content)
-            logger.info(f"Loaded state: {data}")
-            return SessionState.from_dict(data)
+        # Storage hands back the same cached string while the file is
+        # unchanged, so this comparison is usually an identity check
+        content = await storage.read(state_path)
+        if _loaded is not None and content == _loaded[0]:
+            return replace(_loaded[1])
+
+        data = jsonutil.loads(content)
+        state = SessionState.from_dict(data)
+        _last_saved = content
+        _loaded = (content, state)
+        logger.info(f"Loaded state: {data}")
+        return replace(state)
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.warning(f"Could not load state: {e}")
 
@@ -59,22 +132,60 @@ async def load_state() -> SessionState:
 
 
 async def save_state(state: SessionState) -> None:
-    """Save state to Think OS."""
+    """Save state to Think OS (skipped if the file already has this content)."""
+    global _last_saved, _loaded
     storage = get_storage()
     state_path = _get_state_path()
     try:
-        content = json.dumps(state.to_dict(), indent=2, ensure_ascii=False)
+        content = jsonutil.dumps(state.to_dict(), indent=True)
+        if content == _last_saved:
+            logger.debug("State unchanged, skipping save")
+            return
         await storage.write(state_path, content)
+        _last_saved = content
+        _loaded = (content, replace(state))
         logger.debug(f"Saved state to {state_path}")
     except Exception as e:
         logger.error(f"Could not save state: {e}")
 
 
+async def flush_state() -> None:
+    """Write the pending state update, if any. Call before shutting down."""
+    global _pending_state
+    state = _pending_state
+    if state is None:
+        return
+    await save_state(state)
+    # A newer update may have arrived while saving; leave it pending
+    if _pending_state is state:
+        _pending_state = None
+
+
+async def _flush_after(delay: float) -> None:
+    """Flush pending state after delay, until nothing is left pending."""
+    while _pending_state is not None:
+        await asyncio.sleep(delay)
+        await flush_state()
+
+
 async def update_state(**updates) -> SessionState:
-    """Load, update, and save state in one operation."""
+    """Load and update state in one operation.
+
+    The write is debounced: consecutive updates are coalesced and saved
+    once, FLUSH_DELAY_SECONDS after the first. Setting an ISO datetime
+    field also sets its *_ts twin (see TIMESTAMP_FIELDS).
+    """
+    global _pending_state, _flush_task
+    for iso_key, ts_key in TIMESTAMP_FIELDS.items():
+        if iso_key in updates:
+            updates[ts_key] = _iso_to_ts(updates[iso_key])
+
     state = await load_state()
     for key, value in updates.items():
         if hasattr(state, key):
             setattr(state, key, value)
-    await save_state(state)
-    return state
+
+    _pending_state = state
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_flush_after(FLUSH_DELAY_SECONDS))
+    return replace(state)
@@ -33,6 +33,23 @@ class StorageBackend(ABC):
         """
         pass
 
+    async def append(self, path: str, content: str) -> None:
+        """Append content to file, on a new line if the file already exists.
+
+        The default reads and rewrites the whole file. Backends that can
+        append in place should override this.
+
+        Args:
+            path: Full resolved path to the file.
+            content: Content to append.
+
+        Raises:
+            IOError: If write fails.
+        """
+        if await self.exists(path):
+            content = await self.read(path) + "\n" + content
+        await self.write(path, content)
+
     @abstractmethod
     async def exists(self, path: str) -> bool:
         """Check if file exists.
@@ -1,36 +1,73 @@
+import asyncio
 import logging
+import os
+import stat
 from pathlib import Path
 
 from .base import StorageBackend
 
 logger = logging.getLogger(__name__)
 
+# path -> (mtime_ns, size, content). A cheap stat decides whether the file
+# changed since we last read it, so unchanged files are never reopened.
+_FILE_CACHE: dict[str, tuple[int, int, str]] = {}
+
+
+def _write_file(path: str, content: str) -> None:
+    file_path = Path(path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text(content, encoding="utf-8")
+
+
+def _append_file(path: str, content: str) -> None:
+    file_path = Path(path)
+    if file_path.exists():
+        content = "\n" + content
+    else:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+    with file_path.open("a", encoding="utf-8") as f:
+        f.write(content)
+
 
 class LocalStorage(StorageBackend):
     """Local filesystem storage backend."""
 
     async def read(self, path: str) -> str:
-        """Read file from local filesystem."""
-        file_path = Path(path)
+        """Read file from local filesystem (cached until mtime/size change).
 
-        if not file_path.exists():
+        Cache hits return without leaving the event loop; actual reads run
+        in a worker thread.
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            _FILE_CACHE.pop(path, None)
             raise FileNotFoundError(f"File not found: {path}")
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise IOError(f"Not a file: {path}")
 
-        content = file_path.read_text(encoding="utf-8")
+        cached = _FILE_CACHE.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        content = await asyncio.to_thread(Path(path).read_text, encoding="utf-8")
+        _FILE_CACHE[path] = (st.st_mtime_ns, st.st_size, content)
         logger.debug(f"LocalStorage.read: {path} ({len(content)} chars)")
         return content
 
     async def write(self, path: str, content: str) -> None:
         """Write file to local filesystem."""
-        file_path = Path(path)
-
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content, encoding="utf-8")
+        await asyncio.to_thread(_write_file, path, content)
+        _FILE_CACHE.pop(path, None)
         logger.debug(f"LocalStorage.write: {path} ({len(content)} chars)")
 
+    async def append(self, path: str, content: str) -> None:
+        """Append to file in place, without rereading it."""
+        await asyncio.to_thread(_append_file, path, content)
+        _FILE_CACHE.pop(path, None)
+        logger.debug(f"LocalStorage.append: {path} ({len(content)} chars)")
+
     async def exists(self, path: str) -> bool:
         """Check if file exists on local filesystem."""
-        return Path(path).exists()
+        return await asyncio.to_thread(os.path.exists, path)
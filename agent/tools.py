@@ -1,5 +1,9 @@
+import asyncio
 import logging
+import re
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path, PurePath
 
 from config.settings import THINK_OS_PATH
@@ -46,16 +50,99 @@ BLOCKED_PATHS = [
 # ACCESS CONTROL FUNCTIONS
 # =============================================================================
 
-def _matches_any_pattern(path: str, patterns: list[str]) -> bool:
-    """Check if path matches any of the glob patterns.
-
-    Uses PurePath.match() which supports ** for recursive directory matching.
+def _segment_regex(segment: str) -> re.Pattern:
+    """Compile one glob path segment (* and ? never cross a "/")."""
+    parts = []
+    for ch in segment:
+        if ch == "*":
+            parts.append("[^/]*")
+        elif ch == "?":
+            parts.append("[^/]")
+        else:
+            parts.append(re.escape(ch))
+    return re.compile("".join(parts))
+
+
+class _PatternTrie:
+    """Glob patterns indexed by path segment, last segment first.
+
+    Matching follows PurePath.match(): relative patterns match from the
+    right, so "*.secret.md" matches at any depth, and ** behaves like *.
+    A path is checked in one walk over its segments, whatever the number
+    of patterns.
     """
-    p = PurePath(path)
-    for pattern in patterns:
-        if p.match(pattern):
+
+    __slots__ = ("literal", "globs", "terminal")
+
+    def __init__(self, patterns: list[str]):
+        self.literal: dict[str, _PatternTrie] = {}
+        self.globs: dict[str, tuple[re.Pattern, _PatternTrie]] = {}
+        self.terminal = False
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern: str) -> None:
+        node = self
+        for segment in reversed(pattern.split("/")):
+            if "*" in segment or "?" in segment:
+                if segment not in node.globs:
+                    node.globs[segment] = (_segment_regex(segment), _PatternTrie([]))
+                node = node.globs[segment][1]
+            else:
+                if segment not in node.literal:
+                    node.literal[segment] = _PatternTrie([])
+                node = node.literal[segment]
+        node.terminal = True
+
+    def match(self, segments: list[str], i: int | None = None) -> bool:
+        """Check if the path given as segments matches any pattern."""
+        if i is None:
+            i = len(segments) - 1
+        if self.terminal:
             return True
-    return False
+        if i < 0:
+            return False
+        segment = segments[i]
+        child = self.literal.get(segment)
+        if child is not None and child.match(segments, i - 1):
+            return True
+        for regex, child in self.globs.values():
+            if regex.fullmatch(segment) and child.match(segments, i - 1):
+                return True
+        return False
+
+
+_READABLE_TRIE = _PatternTrie(READABLE_PATHS)
+_WRITABLE_TRIE = _PatternTrie(WRITABLE_PATHS)
+_BLOCKED_TRIE = _PatternTrie(BLOCKED_PATHS)
+
+
+# The rule lists are constants, so decisions never need invalidating
+@lru_cache(maxsize=512)
+def _access_denial(match_path: str, for_write: bool) -> str | None:
+    """Check a normalized relative path against the access rules.
+
+    Returns None if allowed, "blocked" if blocked, otherwise the action
+    ("read" or "write") whose allowlist doesn't include the path.
+    """
+    segments = match_path.split("/")
+    if _BLOCKED_TRIE.match(segments):
+        return "blocked"
+    allowed = _WRITABLE_TRIE if for_write else _READABLE_TRIE
+    if not allowed.match(segments):
+        return "write" if for_write else "read"
+    return None
+
+
+_THINK_OS_ROOT: Path | None = None
+
+
+def _think_os_root() -> Path:
+    """Get the resolved Think OS root (resolved once, on first use)."""
+    global _THINK_OS_ROOT
+    if _THINK_OS_ROOT is None:
+        _THINK_OS_ROOT = Path(THINK_OS_PATH).resolve()
+    return _THINK_OS_ROOT
 
 
 def _validate_path(path: str, for_write: bool = False) -> tuple[bool, str, str]:
@@ -63,7 +150,7 @@ def _validate_path(path: str, for_write: bool = False) -> tuple[bool, str, str]:
     if not THINK_OS_PATH:
         return False, "THINK_OS_PATH not configured", ""
 
-    think_os_root = Path(THINK_OS_PATH).resolve()
+    think_os_root = _think_os_root()
 
     if Path(path).is_absolute():
         try:
@@ -80,15 +167,16 @@ def _validate_path(path: str, for_write: bool = False) -> tuple[bool, str, str]:
     except ValueError:
         return False, f"Path traversal detected: {path}", ""
 
-    if _matches_any_pattern(rel_path, BLOCKED_PATHS):
+    # Normalize ("./now.md", "tinker/", "a//b") so equivalent paths share a cache entry
+    denial = _access_denial(PurePath(rel_path).as_posix(), for_write)
+
+    if denial == "blocked":
         logger.warning(f"ACCESS DENIED (blocked): {rel_path}")
         return False, f"Access denied: {rel_path}", ""
 
-    allowed_patterns = WRITABLE_PATHS if for_write else READABLE_PATHS
-    if not _matches_any_pattern(rel_path, allowed_patterns):
-        action = "write" if for_write else "read"
-        logger.warning(f"ACCESS DENIED (not in {action} allowlist): {rel_path}")
-        return False, f"Not allowed to {action}: {rel_path}", ""
+    if denial:
+        logger.warning(f"ACCESS DENIED (not in {denial} allowlist): {rel_path}")
+        return False, f"Not allowed to {denial}: {rel_path}", ""
 
     return True, str(full_path), rel_path
 
@@ -111,7 +199,7 @@ async def read_think_os(path: str) -> dict:
         if full_path.is_dir():
             files = []
             for item in sorted(full_path.iterdir()):
-                rel_item = str(item.relative_to(Path(THINK_OS_PATH)))
+                rel_item = str(item.relative_to(_think_os_root()))
                 if item.is_dir():
                     files.append(f"{rel_item}/")
                 else:
@@ -119,16 +207,25 @@ async def read_think_os(path: str) -> dict:
             logger.info(f"LIST: {rel_path} ({len(files)} items)")
             return {"success": True, "type": "directory", "files": files}
 
-        if not await storage.exists(str(full_path)):
-            return {"success": False, "error": f"File not found: {path}"}
-
         content = await storage.read(str(full_path))
         logger.info(f"READ: {rel_path} ({len(content)} chars)")
         return {"success": True, "type": "file", "content": content}
+    except FileNotFoundError:
+        return {"success": False, "error": f"File not found: {path}"}
     except Exception as e:
         return {"success": False, "error": f"Read error: {e}"}
 
 
+async def read_think_os_batch(paths: list[str]) -> dict:
+    """Read several files or directories from Think OS concurrently.
+
+    Each path gets the same result read_think_os would return for it.
+    """
+    results = await asyncio.gather(*(read_think_os(path) for path in paths))
+    logger.info(f"READ BATCH: {len(paths)} paths")
+    return {"success": True, "results": dict(zip(paths, results))}
+
+
 async def write_think_os(path: str, content: str, mode: str = "overwrite") -> dict:
     """Write content to a file in Think OS.
 
@@ -145,11 +242,10 @@ async def write_think_os(path: str, content: str, mode: str = "overwrite") -> di
     storage = get_storage()
 
     try:
-        if mode == "append" and await storage.exists(full_path):
-            existing = await storage.read(full_path)
-            content = existing + "\n" + content
-
-        await storage.write(full_path, content)
+        if mode == "append":
+            await storage.append(full_path, content)
+        else:
+            await storage.write(full_path, content)
         logger.info(f"WRITE ({mode}): {rel_path} ({len(content)} chars)")
         return {"success": True}
     except Exception as e:
@@ -157,25 +253,45 @@ async def write_think_os(path: str, content: str, mode: str = "overwrite") -> di
         return {"success": False, "error": f"Write error: {e}"}
 
 
+# Calls within this many seconds share one result (bursts of tool calls)
+TIME_CACHE_TTL = 0.05
+_time_cache: tuple[float, dict | None] = (0.0, None)
+
+
 def get_current_time() -> dict:
     """Get current date and time."""
+    global _time_cache
+    checked = time.monotonic()
+    cached_at, cached = _time_cache
+    if cached is not None and checked - cached_at < TIME_CACHE_TTL:
+        return cached
+
     now = datetime.now()
-    return {
+    result = {
         "success": True,
         "datetime": now.isoformat(timespec="seconds"),
         "date": now.strftime("%Y-%m-%d"),
         "time": now.strftime("%H:%M"),
         "weekday": now.strftime("%A"),
     }
+    _time_cache = (checked, result)
+    return result
 
 
 # =============================================================================
 # TOOL DEFINITIONS FOR CLAUDE API
 # =============================================================================
 
-TOOL_DEFINITIONS = [
+# Tool names, shared by the definitions, the dispatch table and callers
+READ_TOOL = "read_think_os"
+BATCH_READ_TOOL = "read_think_os_batch"
+WRITE_TOOL = "write_think_os"
+TIME_TOOL = "get_current_time"
+
+# A tuple so callers can share it without defensive copies
+TOOL_DEFINITIONS = (
     {
-        "name": "read_think_os",
+        "name": READ_TOOL,
         "description": (
             "Read a file or list a directory from Think OS. "
             "If path is a directory, returns list of files. "
@@ -195,7 +311,26 @@ TOOL_DEFINITIONS = [
         }
     },
     {
-        "name": "write_think_os",
+        "name": BATCH_READ_TOOL,
+        "description": (
+            "Read several files or directories from Think OS in one call. "
+            "Same access rules as read_think_os. Returns one result per path. "
+            "Prefer this over repeated read_think_os calls when you need multiple files."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Relative paths, e.g., ['memory/spark/protocol.md', 'memory/timeline/daily/2025-12-20.md']"
+                }
+            },
+            "required": ["paths"]
+        }
+    },
+    {
+        "name": WRITE_TOOL,
         "description": (
             "Write content to a file in Think OS. "
             "Allowed: memory/timeline/daily/*.md, memory/timeline/todo/*.md, memory/spark/*.md."
@@ -221,7 +356,7 @@ TOOL_DEFINITIONS = [
         }
     },
     {
-        "name": "get_current_time",
+        "name": TIME_TOOL,
         "description": "Get current date and time.",
         "input_schema": {
             "type": "object",
@@ -229,31 +364,89 @@ TOOL_DEFINITIONS = [
             "required": []
         }
     }
-]
+)
+
+
+def convert_tools_to_openai(anthropic_tools: tuple) -> tuple:
+    """Convert Anthropic tool definitions to OpenAI format."""
+    return tuple(
+        {
+            "type": "function",
+            "function": {
+                "name": tool["name"],
+                "description": tool["description"],
+                "parameters": tool["input_schema"],
+            }
+        }
+        for tool in anthropic_tools
+    )
+
+
+# Request-ready tool lists, built once since the definitions never change.
+# The Anthropic one marks the last tool as a prompt cache breakpoint.
+ANTHROPIC_TOOL_DEFINITIONS = (
+    *TOOL_DEFINITIONS[:-1],
+    {**TOOL_DEFINITIONS[-1], "cache_control": {"type": "ephemeral"}},
+)
+OPENAI_TOOL_DEFINITIONS = convert_tools_to_openai(TOOL_DEFINITIONS)
+
+
+async def _handle_read(input_data: dict) -> dict:
+    return await read_think_os(input_data.get("path", ""))
+
+
+async def _handle_batch_read(input_data: dict) -> dict:
+    paths = input_data.get("paths")
+    if not isinstance(paths, list) or not all(isinstance(p, str) for p in paths):
+        return {"success": False, "error": "paths must be a list of strings"}
+    return await read_think_os_batch(paths)
+
+
+async def _handle_write(input_data: dict) -> dict:
+    try:
+        path = input_data["path"]
+        content = input_data["content"]
+    except KeyError as e:
+        return {"success": False, "error": f"Missing required argument: {e.args[0]}"}
+    return await write_think_os(path, content, input_data.get("mode", "overwrite"))
+
+
+async def _handle_time(input_data: dict) -> dict:
+    return get_current_time()
+
+
+# Tool name -> handler taking the tool's input dict
+TOOL_DISPATCH = {
+    READ_TOOL: _handle_read,
+    BATCH_READ_TOOL: _handle_batch_read,
+    WRITE_TOOL: _handle_write,
+    TIME_TOOL: _handle_time,
+}
+
+
+# Models tend to repeat the same wrong name, so share one result per name
+@lru_cache(maxsize=64)
+def _unknown_tool(name: str) -> dict:
+    return {"success": False, "error": f"Unknown tool: {name}"}
 
 
 async def execute_tool(name: str, input_data: dict) -> dict:
     """Execute a tool by name."""
-    if name == "read_think_os":
-        return await read_think_os(input_data.get("path", ""))
-    elif name == "write_think_os":
-        return await write_think_os(
-            input_data.get("path", ""),
-            input_data.get("content", ""),
-            input_data.get("mode", "overwrite")
-        )
-    elif name == "get_current_time":
-        return get_current_time()
-    else:
-        return {"success": False, "error": f"Unknown tool: {name}"}
+    handler = TOOL_DISPATCH.get(name)
+    if handler is None:
+        return _unknown_tool(name)
+    return await handler(input_data)
 
 
-def get_access_summary() -> str:
-    """Return a human-readable summary of access controls."""
-    return f"""
+_ACCESS_SUMMARY = f"""
 Think OS Access Controls:
 -------------------------
 READABLE: {', '.join(READABLE_PATHS)}
 WRITABLE: {', '.join(WRITABLE_PATHS)}
 BLOCKED:  {', '.join(BLOCKED_PATHS)}
 """
+
+
+def get_access_summary() -> str:
+    """Return a human-readable summary of access controls."""
+    return _ACCESS_SUMMARY
@@ -1,16 +1,16 @@
 """Scheduler for proactive messages and orchestrator checks."""
 
+import asyncio
 import json
 import logging
 import random
 import re
+import time
 from datetime import datetime, timedelta
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
-from anthropic import Anthropic
-from openai import OpenAI
 
 from config.settings import (
     ANTHROPIC_API_KEY, TEST_MODE,
@@ -18,12 +18,40 @@ from config.settings import (
     TICK_MIN_MINUTES, TICK_MAX_MINUTES,
     ORCHESTRATOR_PROVIDER, DEEPSEEK_API_KEY,
     QUIET_START, QUIET_END,
+    ORCHESTRATOR_MAX_TOOL_CHARS, ORCHESTRATOR_TOOL_BUDGET_CHARS,
+)
+from agent.clients import get_async_anthropic_client, get_async_deepseek_client
+from agent.tools import (
+    read_think_os, get_current_time, ANTHROPIC_TOOL_DEFINITIONS, OPENAI_TOOL_DEFINITIONS, execute_tool,
+    WRITE_TOOL,
 )
-from agent.tools import read_think_os, get_current_time, TOOL_DEFINITIONS, execute_tool
 from agent.state import load_state, update_state, SessionState
+from agent import jsonutil
 
 logger = logging.getLogger(__name__)
 
+# Duration patterns for parse_duration_minutes (text is lowercased first)
+_HOUR_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:hour|hr)s?')
+_MIN_RE = re.compile(r'(\d+)\s*(?:min(?:ute)?s?)')
+
+# Start of the orchestrator's decision object when it isn't in a ```json block
+_JSON_DECISION_RE = re.compile(r'\{[^{}]*"should_message"')
+
+# Quiet hours lookup: _QUIET_HOURS[hour] is True when ticks are suppressed.
+# QUIET_START > QUIET_END means the window wraps midnight (e.g., 23 to 8).
+_QUIET_HOURS = tuple(
+    (h >= QUIET_START or h < QUIET_END) if QUIET_START > QUIET_END else (QUIET_START <= h < QUIET_END)
+    for h in range(24)
+)
+
+# Fixed daily check-ins (hour, minute)
+MORNING_STARTUP_TIME = (8, 0)
+EVENING_WRAPUP_TIME = (21, 0)
+
+# Local pre-classifier: ticks that are obviously silent skip the LLM
+RECENT_REPLY_MINUTES = 15  # user just talked to us
+CHECKIN_WINDOW_MINUTES = 20  # a fixed check-in is about to / just did go out
+
 
 def parse_duration_minutes(text: str) -> int | None:
     """Parse duration from user message. Returns minutes or None.
@@ -38,18 +66,122 @@ def parse_duration_minutes(text: str) -> int | None:
     text = text.lower()
 
     # Pattern: N hour(s)
-    hour_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:hour|hr)s?', text)
+    hour_match = _HOUR_RE.search(text)
     if hour_match:
         hours = float(hour_match.group(1))
         return int(hours * 60)
 
     # Pattern: N min(ute)(s)
-    min_match = re.search(r'(\d+)\s*(?:min(?:ute)?s?)', text)
+    min_match = _MIN_RE.search(text)
     if min_match:
         return int(min_match.group(1))
 
     return None
 
+
+_DECODER = json.JSONDecoder()
+
+
+def _decode_object(text: str, start: int) -> dict | None:
+    """Decode the JSON object opening at text[start], or None if there isn't one."""
+    try:
+        obj, _ = _DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def _extract_decision(text: str) -> dict | None:
+    """Find the orchestrator's decision object in its reply.
+
+    A ```json block wins; otherwise the first object with a "should_message"
+    key. raw_decode handles braces inside strings, and a candidate that
+    doesn't parse falls through to the next "{".
+    """
+    block_start = text.find('```json')
+    if block_start != -1:
+        brace_start = text.find('{', block_start)
+        if brace_start != -1:
+            decision = _decode_object(text, brace_start)
+            if decision is not None:
+                return decision
+
+    match = _JSON_DECISION_RE.search(text)
+    start = match.start() if match else text.find('{')
+    while start != -1:
+        decision = _decode_object(text, start)
+        if decision is not None and "should_message" in decision:
+            return decision
+        start = text.find('{', start + 1)
+    return None
+
+
+def _cap_content(result: dict) -> dict:
+    """Cut a file result's content to ORCHESTRATOR_MAX_TOOL_CHARS with a marker."""
+    content = result.get("content")
+    if not isinstance(content, str):
+        return result
+    extra = len(content) - ORCHESTRATOR_MAX_TOOL_CHARS
+    if extra <= 0:
+        return result
+    return {**result, "content": content[:ORCHESTRATOR_MAX_TOOL_CHARS] + f"...[truncated {extra} chars]"}
+
+
+def _tool_payload(result: dict) -> str:
+    """Serialize a tool result once for the model (compact, non-ASCII kept).
+
+    Oversized file contents are cut to ORCHESTRATOR_MAX_TOOL_CHARS each, so
+    one large file in a batch read doesn't crowd out the others.
+    """
+    if isinstance(result.get("results"), dict):
+        result = {**result, "results": {path: _cap_content(r) for path, r in result["results"].items()}}
+    return jsonutil.dumps(_cap_content(result))
+
+
+# Sent instead of running a tool once the tick's tool budget is spent
+_TOOL_BUDGET_PAYLOAD = jsonutil.dumps({
+    "success": False,
+    "error": "Tool budget for this check is used up. Decide with what you've already read.",
+})
+
+
+async def _run_tool(tool_name: str, tool_input: dict, used_chars: int) -> str:
+    """Execute one orchestrator tool call and return its payload for the model.
+
+    used_chars is how much tool output this tick has already sent; once it
+    reaches ORCHESTRATOR_TOOL_BUDGET_CHARS reads are no longer run. Writes
+    always run, since the budget only limits what the model has to read.
+    """
+    logger.info("Tool: %s(%s)", tool_name, tool_input)
+    if tool_name != WRITE_TOOL and used_chars >= ORCHESTRATOR_TOOL_BUDGET_CHARS:
+        logger.info("Tool budget spent (%d chars), skipping %s", used_chars, tool_name)
+        return _TOOL_BUDGET_PAYLOAD
+    result = await execute_tool(tool_name, tool_input)
+    payload = _tool_payload(result)
+    logger.info("Tool result: %d chars", len(payload))
+    return payload
+
+
+async def _run_tools(calls: list[tuple[str, dict]], used_chars: int) -> list[str]:
+    """Run one turn's (tool_name, tool_input) calls; payloads come back in call order.
+
+    Reads are independent and run concurrently. They are all checked against
+    the budget as it stood before the turn, so one turn can overshoot it by
+    up to that turn's own output. A turn that writes runs in order, so a read
+    after a write in the same turn sees it.
+    """
+    if any(tool_name == WRITE_TOOL for tool_name, _ in calls):
+        payloads = []
+        for tool_name, tool_input in calls:
+            payload = await _run_tool(tool_name, tool_input, used_chars)
+            used_chars += len(payload)
+            payloads.append(payload)
+        return payloads
+    return list(await asyncio.gather(
+        *(_run_tool(tool_name, tool_input, used_chars) for tool_name, tool_input in calls)
+    ))
+
+
 # Model configs per provider
 PROVIDER_CONFIGS = {
     "anthropic": {
@@ -87,21 +219,6 @@ def get_style_boost() -> str:
     return get_orchestrator_config().get("style_boost", "")
 
 
-def convert_tools_to_openai(anthropic_tools: list) -> list:
-    """Convert Anthropic tool definitions to OpenAI format."""
-    openai_tools = []
-    for tool in anthropic_tools:
-        openai_tools.append({
-            "type": "function",
-            "function": {
-                "name": tool["name"],
-                "description": tool["description"],
-                "parameters": tool["input_schema"],
-            }
-        })
-    return openai_tools
-
-
 # TEST_MODE uses same prompt as production now
 ORCHESTRATOR_PROMPT_TEST = None  # Will fall back to ORCHESTRATOR_PROMPT
 
@@ -110,6 +227,7 @@ ORCHESTRATOR_PROMPT = """You're Spark - the accountability friend who actually k
 ## YOUR TOOLS
 
 You have access to `read_think_os` to read files. USE IT. Don't guess - actually read.
+Use `read_think_os_batch` to read all the files below in ONE call instead of one at a time.
 
 **Files you MUST read before deciding:**
 - `memory/{{user_name}}.md` - WHO THEY ARE. Their patterns, values, guilt triggers. READ THIS CAREFULLY.
@@ -224,34 +342,56 @@ Think out loud using this framework, then give JSON:
 class Scheduler:
     """Manages scheduled tasks and proactive messaging."""
 
-    def __init__(self, send_message_callback, get_conversation_history=None, add_to_history=None):
+    def __init__(self, send_message_callback, get_conversation_history=None, add_to_history=None,
+                 is_user_interacting=None):
         """
         Args:
             send_message_callback: Async function to send Telegram message.
             get_conversation_history: Function to get recent conversation history.
             add_to_history: Function to add a message to conversation history.
+            is_user_interacting: Function returning True while the coach is handling the user.
         """
         self.send_message = send_message_callback
         self.get_history = get_conversation_history
         self.add_to_history = add_to_history
+        self.is_user_interacting = is_user_interacting or (lambda: False)
         self.scheduler = AsyncIOScheduler()
         self.state: SessionState | None = None  # Loaded on first use
 
-        # Initialize clients based on provider
-        self.anthropic_client = Anthropic(api_key=ANTHROPIC_API_KEY) if ANTHROPIC_API_KEY else None
-        self.deepseek_client = OpenAI(
-            api_key=DEEPSEEK_API_KEY,
-            base_url="https://api.deepseek.com"
-        ) if DEEPSEEK_API_KEY else None
-
         self.provider = ORCHESTRATOR_PROVIDER
-        logger.info(f"Orchestrator provider: {self.provider}")
+        logger.info("Orchestrator provider: %s", self.provider)
+
+        # Use the shared client for this provider (and its connection pool).
+        # A missing key is reported on each tick rather than failing startup.
+        self.anthropic_client = None
+        self.deepseek_client = None
+        if self.provider == "deepseek":
+            if DEEPSEEK_API_KEY:
+                self.deepseek_client = get_async_deepseek_client()
+        elif ANTHROPIC_API_KEY:
+            self.anthropic_client = get_async_anthropic_client()
+
+        # The system prompt only depends on settings, so format it once.
+        # Byte-identical prompts every tick also keep the prompt cache warm.
+        style_instruction = SPARK_STYLE if SPARK_STYLE else "Text like a friend who roasts. Mean, direct, no filter."
+        self._system_prompt = ORCHESTRATOR_PROMPT.format(
+            style_instruction=style_instruction, format_hint=get_format_hint()
+        )
+        # Add style boost for providers that need it (e.g., DeepSeek savage mode)
+        style_boost = get_style_boost()
+        if style_boost:
+            self._system_prompt += "\n" + style_boost
+        logger.info("Orchestrator system prompt: %d chars", len(self._system_prompt))
+
+        # Date-dependent part of the tick context (see _load_context)
+        self._static_context: str | None = None
+        self._static_context_date: str | None = None
 
     async def _ensure_state(self, force_reload: bool = False) -> SessionState:
         """Load state, optionally forcing a reload from disk."""
         if self.state is None or force_reload:
             self.state = await load_state()
-            logger.info(f"Loaded session state: unanswered={self.state.unanswered_count}")
+            logger.info("Loaded session state: unanswered=%d", self.state.unanswered_count)
         return self.state
 
     async def record_interaction(self, summary: str | None = None) -> None:
@@ -293,7 +433,7 @@ class Scheduler:
         deadline = datetime.now() + timedelta(minutes=minutes)
         await self._ensure_state()
         self.state = await update_state(working_until=deadline.isoformat())
-        logger.info(f"Working deadline set: {deadline.strftime('%H:%M')} ({minutes} min from now)")
+        logger.info("Working deadline set: %s (%d min from now)", deadline.strftime('%H:%M'), minutes)
 
     async def check_and_set_working_deadline(self, user_message: str) -> None:
         """Check user message for duration and set deadline if found."""
@@ -301,13 +441,9 @@ class Scheduler:
         if minutes and minutes >= 5:  # Only set for meaningful durations
             await self.set_working_deadline(minutes)
 
-    async def _load_context(self, recent_messages: list[dict] | None = None) -> str:
-        """Load MINIMAL context for orchestrator. It will read files itself via tools."""
+    def _build_static_context(self, today: str, yesterday: str) -> str:
+        """Build the part of the context that only changes with the date."""
         sections = []
-        now = datetime.now()
-        time_info = get_current_time()
-        # Always reload state from disk to get latest unanswered_count
-        state = await self._ensure_state(force_reload=True)
 
         # 0. User info
         user_info = []
@@ -321,29 +457,46 @@ class Scheduler:
         if user_info:
             sections.append(f"User: {', '.join(user_info)}")
 
-        # 1. Recent conversation (CRITICAL for avoiding repetition)
-        if recent_messages:
-            def format_msg(m):
-                if m['role'] == 'assistant':
-                    return f"- Spark: {m['content']}"
-                else:
-                    name = USER_NAME or "User"
-                    return f"- {name}: {m['content']}"
-            convo = "\n".join([format_msg(m) for m in recent_messages])
-            sections.append(f"Recent conversation (today) - CHECK THIS TO AVOID REPEATING YOURSELF:\n{convo}")
-        else:
-            sections.append("Recent conversation: None yet today")
+        # 1. Dates
+        sections.append(f"Today's date: {today}")
+        sections.append(f"Yesterday's date: {yesterday}")
+
+        # 2. Tell it what files to read
+        sections.append(f"""
+FILES TO READ (use read_think_os_batch with all of these in one call):
+- memory/{USER_NAME}.md ← MUST READ. Their profile, patterns, guilt triggers.
+- memory/spark/protocol.md ← Your personality
+- memory/spark/learned.md ← What you've learned
+- memory/timeline/daily/{today}.md ← Today's plan
+- memory/timeline/daily/{yesterday}.md ← Yesterday
+- memory/timeline/perspective.md ← Their goals
+""")
+
+        return "\n\n".join(sections)
+
+    async def _load_context(self, recent_messages: list[dict] | None = None) -> str:
+        """Load MINIMAL context for orchestrator. It will read files itself via tools.
 
-        # 2. Essential metadata
+        The date-dependent part comes first and is reused all day, so
+        consecutive ticks share a prefix; volatile state and the recent
+        conversation come last.
+        """
+        now = datetime.now()
+        time_info = get_current_time()
+        # orchestrator_tick has just reloaded state from disk
+        state = await self._ensure_state()
+
+        if time_info["date"] != self._static_context_date:
+            yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
+            self._static_context = self._build_static_context(time_info["date"], yesterday)
+            self._static_context_date = time_info["date"]
+        sections = [self._static_context]
+
+        # 3. Volatile metadata
         sections.append(f"Current time: {time_info['datetime']} ({time_info['weekday']})")
-        sections.append(f"Today's date: {time_info['date']}")
-        yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
-        sections.append(f"Yesterday's date: {yesterday}")
 
-        if state.last_interaction:
-            last = datetime.fromisoformat(state.last_interaction)
-            delta = now - last
-            minutes = delta.total_seconds() / 60
+        if state.last_interaction_ts:
+            minutes = (time.time() - state.last_interaction_ts) / 60
             sections.append(f"Last user reply: {minutes:.0f} min ago")
         else:
             sections.append("Last user reply: None (never replied)")
@@ -356,16 +509,18 @@ class Scheduler:
         if state.current_focus:
             sections.append(f"Today's focus: {state.current_focus}")
 
-        # 3. Tell it what files to read
-        sections.append(f"""
-FILES TO READ (use read_think_os tool):
-- memory/{USER_NAME}.md ← MUST READ. Their profile, patterns, guilt triggers.
-- memory/spark/protocol.md ← Your personality
-- memory/spark/learned.md ← What you've learned
-- memory/timeline/daily/{time_info['date']}.md ← Today's plan
-- memory/timeline/daily/{yesterday}.md ← Yesterday
-- memory/timeline/perspective.md ← Their goals
-""")
+        # 4. Recent conversation (CRITICAL for avoiding repetition)
+        if recent_messages:
+            def format_msg(m):
+                if m['role'] == 'assistant':
+                    return f"- Spark: {m['content']}"
+                else:
+                    name = USER_NAME or "User"
+                    return f"- {name}: {m['content']}"
+            convo = "\n".join([format_msg(m) for m in recent_messages])
+            sections.append(f"Recent conversation (today) - CHECK THIS TO AVOID REPEATING YOURSELF:\n{convo}")
+        else:
+            sections.append("Recent conversation: None yet today")
 
         return "\n\n".join(sections)
 
@@ -381,112 +536,121 @@ FILES TO READ (use read_think_os tool):
                 logger.warning("Orchestrator: No Anthropic API key configured")
                 return
 
+        now = datetime.now()
+        now_ts = now.timestamp()
+
         # Check quiet hours
-        current_hour = datetime.now().hour
-        if QUIET_START > QUIET_END:  # e.g., 23 to 8 (overnight)
-            in_quiet = current_hour >= QUIET_START or current_hour < QUIET_END
-        else:  # e.g., 1 to 6
-            in_quiet = QUIET_START <= current_hour < QUIET_END
-        if in_quiet:
-            logger.info(f"Orchestrator tick skipped: quiet hours ({QUIET_START}:00-{QUIET_END}:00)")
+        if _QUIET_HOURS[now.hour]:
+            logger.info("Orchestrator tick skipped: quiet hours (%d:00-%d:00)", QUIET_START, QUIET_END)
             return
 
         # Check EARLY if user is interacting - skip entire tick if so
-        from bot.telegram import is_user_interacting
-        if is_user_interacting():
+        if self.is_user_interacting():
             logger.info("Orchestrator tick skipped: user is interacting")
             return
 
         # Message frequency guard - don't call LLM if we just sent a message
         # (disabled in TEST_MODE for faster iteration)
         state = await self._ensure_state(force_reload=True)
-        if not TEST_MODE and state.last_spark_message:
-            since = (datetime.now() - datetime.fromisoformat(state.last_spark_message)).total_seconds() / 60
+        if not TEST_MODE and state.last_spark_ts:
+            since = (now_ts - state.last_spark_ts) / 60
             if since < 5:
-                logger.info(f"Orchestrator tick skipped: sent message {since:.0f} min ago (< 5 min)")
+                logger.info("Orchestrator tick skipped: sent message %.0f min ago (< 5 min)", since)
                 return
 
         # Working deadline guard - user said "30 min" etc, respect their time
-        now = datetime.now()
-        if state.working_until:
-            deadline = datetime.fromisoformat(state.working_until)
-            if now < deadline:
-                minutes_left = (deadline - now).total_seconds() / 60
-                logger.info(f"Orchestrator tick skipped: user working until {deadline.strftime('%H:%M')} ({minutes_left:.0f} min left)")
+        if state.working_until_ts:
+            deadline = datetime.fromtimestamp(state.working_until_ts).strftime('%H:%M')
+            if now_ts < state.working_until_ts:
+                minutes_left = (state.working_until_ts - now_ts) / 60
+                logger.info("Orchestrator tick skipped: user working until %s (%.0f min left)", deadline, minutes_left)
                 return
             else:
                 # Deadline passed, clear it
-                logger.info(f"Working deadline {deadline.strftime('%H:%M')} has passed, clearing")
+                logger.info("Working deadline %s has passed, clearing", deadline)
                 self.state = await update_state(working_until=None)
 
-        logger.info(f"Orchestrator tick ({self.provider})...")
+        # Obvious "stay silent" cases - answer locally instead of asking the LLM
+        if not TEST_MODE:
+            reason = self._silent_reason(state, now)
+            if reason:
+                logger.info("Orchestrator tick skipped: %s", reason)
+                return
+
+        logger.info("Orchestrator tick (%s)...", self.provider)
 
         try:
             # Get recent conversation if available
             recent = self.get_history() if self.get_history else None
-            logger.info(f"Orchestrator history ({len(recent) if recent else 0} messages):")
-            if recent:
-                for i, msg in enumerate(recent[-10:]):  # Last 10 messages
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Orchestrator history (%d messages):", len(recent) if recent else 0)
+                for i, msg in enumerate((recent or [])[-10:]):  # Last 10 messages
                     content_preview = msg['content'][:100].replace('\n', '\\n')
-                    logger.info(f"  [{i}] {msg['role']}: {content_preview}...")
+                    logger.debug("  [%d] %s: %s...", i, msg['role'], content_preview)
             context = await self._load_context(recent)
 
-            # Format prompt with style instruction and model-specific hints
-            style_instruction = SPARK_STYLE if SPARK_STYLE else "Text like a friend who roasts. Mean, direct, no filter."
-            format_hint = get_format_hint()
-            style_boost = get_style_boost()
-            prompt = ORCHESTRATOR_PROMPT.format(style_instruction=style_instruction, format_hint=format_hint)
-            # Add style boost for providers that need it (e.g., DeepSeek savage mode)
-            if style_boost:
-                prompt = prompt + "\n" + style_boost
-
-            user_message = f"Context:\n\n{context}\n\nFirst, use read_think_os to read the profile and other relevant files. Then decide if you should send a message."
+            user_message = f"Context:\n\n{context}\n\nFirst, use read_think_os_batch to read the profile and other relevant files in one call. Then decide if you should send a message."
 
             # Route to appropriate provider
             if self.provider == "deepseek":
-                await self._orchestrator_tick_deepseek(prompt, user_message)
+                await self._orchestrator_tick_deepseek(self._system_prompt, user_message)
             else:
-                await self._orchestrator_tick_anthropic(prompt, user_message)
+                await self._orchestrator_tick_anthropic(self._system_prompt, user_message)
 
         except Exception as e:
-            logger.error(f"Orchestrator error: {e}", exc_info=True)
+            logger.error("Orchestrator error: %s", e, exc_info=True)
+
+    def _silent_reason(self, state: SessionState, now: datetime) -> str | None:
+        """Return why this tick is clearly silent, or None if the LLM should decide."""
+        if state.last_interaction_ts and not state.stuck_on:
+            since = (now.timestamp() - state.last_interaction_ts) / 60
+            if since < RECENT_REPLY_MINUTES:
+                return f"user replied {since:.0f} min ago (< {RECENT_REPLY_MINUTES} min)"
+
+        minute_of_day = now.hour * 60 + now.minute
+        for name, (hour, minute) in (("morning startup", MORNING_STARTUP_TIME),
+                                     ("evening wrapup", EVENING_WRAPUP_TIME)):
+            if abs(minute_of_day - (hour * 60 + minute)) <= CHECKIN_WINDOW_MINUTES:
+                return f"within {CHECKIN_WINDOW_MINUTES} min of {name}"
+
+        return None
 
     async def _orchestrator_tick_anthropic(self, system_prompt: str, user_message: str) -> None:
         """Run orchestrator tick using Anthropic API."""
         config = get_orchestrator_config()
         messages = [{"role": "user", "content": user_message}]
+        tool_chars = 0  # tool output sent back so far this tick
 
         max_turns = 10
         for turn in range(max_turns):
-            response = self.anthropic_client.messages.create(
+            # The user started talking to the coach - drop the rest of this tick
+            if turn and self.is_user_interacting():
+                logger.info("Orchestrator: user is interacting, abandoning tick")
+                return None
+
+            # System prompt and tools are identical every tick, so both are
+            # served from Anthropic's prompt cache after the first call
+            response = await self.anthropic_client.messages.create(
                 model=config["model"],
                 max_tokens=2048,
-                system=system_prompt,
-                tools=TOOL_DEFINITIONS,
+                system=[{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}],
+                tools=ANTHROPIC_TOOL_DEFINITIONS,
                 messages=messages
             )
 
-            logger.info(f"Anthropic turn {turn + 1}, stop_reason: {response.stop_reason}")
+            logger.info("Anthropic turn %d, stop_reason: %s", turn + 1, response.stop_reason)
 
             if response.stop_reason == "tool_use":
-                tool_results = []
                 assistant_content = response.content
+                tool_uses = [block for block in response.content if block.type == "tool_use"]
 
-                for block in response.content:
-                    if block.type == "tool_use":
-                        tool_name = block.name
-                        tool_input = block.input
-                        tool_use_id = block.id
-
-                        logger.info(f"Tool: {tool_name}({json.dumps(tool_input)})")
-                        result = await execute_tool(tool_name, tool_input)
-                        logger.info(f"Tool result: {len(json.dumps(result))} chars")
+                payloads = await _run_tools([(block.name, block.input) for block in tool_uses], tool_chars)
+                tool_chars += sum(map(len, payloads))
 
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": tool_use_id,
-                            "content": json.dumps(result),
-                        })
+                tool_results = [
+                    {"type": "tool_result", "tool_use_id": block.id, "content": payload}
+                    for block, payload in zip(tool_uses, payloads)
+                ]
 
                 messages.append({"role": "assistant", "content": assistant_content})
                 messages.append({"role": "user", "content": tool_results})
@@ -497,7 +661,7 @@ FILES TO READ (use read_think_os tool):
                         text += block.text
                 text = text.strip()
 
-                logger.info(f"Orchestrator decision:\n{text}")
+                logger.info("Orchestrator decision:\n%s", text)
                 await self._handle_orchestrator_decision(text)
                 break
 
@@ -508,112 +672,72 @@ FILES TO READ (use read_think_os tool):
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_message}
         ]
-        openai_tools = convert_tools_to_openai(TOOL_DEFINITIONS)
+        tool_chars = 0  # tool output sent back so far this tick
 
         max_turns = 10
         for turn in range(max_turns):
-            response = self.deepseek_client.chat.completions.create(
+            # The user started talking to the coach - drop the rest of this tick
+            if turn and self.is_user_interacting():
+                logger.info("Orchestrator: user is interacting, abandoning tick")
+                return None
+
+            response = await self.deepseek_client.chat.completions.create(
                 model=config["model"],
                 max_tokens=2048,
                 messages=messages,
-                tools=openai_tools,
+                tools=OPENAI_TOOL_DEFINITIONS,
             )
 
             choice = response.choices[0]
-            logger.info(f"DeepSeek turn {turn + 1}, finish_reason: {choice.finish_reason}")
+            logger.info("DeepSeek turn %d, finish_reason: %s", turn + 1, choice.finish_reason)
 
             if choice.finish_reason == "tool_calls" and choice.message.tool_calls:
                 # Execute tool calls
                 messages.append(choice.message)
 
-                for tool_call in choice.message.tool_calls:
-                    tool_name = tool_call.function.name
-                    tool_input = json.loads(tool_call.function.arguments)
-
-                    logger.info(f"Tool: {tool_name}({json.dumps(tool_input)})")
-                    result = await execute_tool(tool_name, tool_input)
-                    logger.info(f"Tool result: {len(json.dumps(result))} chars")
+                tool_calls = choice.message.tool_calls
+                payloads = await _run_tools(
+                    [(tc.function.name, jsonutil.loads(tc.function.arguments)) for tc in tool_calls], tool_chars
+                )
+                tool_chars += sum(map(len, payloads))
 
+                for tool_call, payload in zip(tool_calls, payloads):
                     messages.append({
                         "role": "tool",
                         "tool_call_id": tool_call.id,
-                        "content": json.dumps(result),
+                        "content": payload,
                     })
             else:
                 text = choice.message.content or ""
                 text = text.strip()
 
-                logger.info(f"Orchestrator decision:\n{text}")
+                logger.info("Orchestrator decision:\n%s", text)
                 await self._handle_orchestrator_decision(text)
                 break
 
     async def _handle_orchestrator_decision(self, text: str) -> None:
         """Parse and act on orchestrator's final decision."""
-        try:
-            # Find JSON block - look for ```json or just find balanced braces containing should_message
-            json_text = None
-
-            # Try to find ```json block first
-            json_block_start = text.find('```json')
-            if json_block_start != -1:
-                # Find the { after ```json
-                brace_start = text.find('{', json_block_start)
-                if brace_start != -1:
-                    # Find matching closing brace
-                    brace_count = 0
-                    for i, char in enumerate(text[brace_start:]):
-                        if char == '{':
-                            brace_count += 1
-                        elif char == '}':
-                            brace_count -= 1
-                            if brace_count == 0:
-                                json_text = text[brace_start:brace_start + i + 1]
-                                break
-
-            if not json_text:
-                # Find any { that's followed by should_message (with possible whitespace)
-                match = re.search(r'\{[^{}]*"should_message"', text)
-                if match:
-                    json_start = match.start()
-                    # Find matching closing brace
-                    brace_count = 0
-                    json_end = json_start
-                    for i, char in enumerate(text[json_start:]):
-                        if char == '{':
-                            brace_count += 1
-                        elif char == '}':
-                            brace_count -= 1
-                            if brace_count == 0:
-                                json_end = json_start + i + 1
-                                break
-                    json_text = text[json_start:json_end]
-
-            if not json_text:
-                logger.warning(f"No JSON found in orchestrator response")
-                return
-
-            decision = json.loads(json_text)
-
-            if decision.get("should_message") and decision.get("message"):
-                # Check if user started interacting while we were thinking
-                from bot.telegram import is_user_interacting
-                if is_user_interacting():
-                    logger.info("Orchestrator: user is interacting, skipping send")
-                    return
+        decision = _extract_decision(text)
+        if decision is None:
+            logger.warning("No JSON decision in orchestrator response: %.100s", text)
+            return
 
-                hypothesis = decision.get("hypothesis", "unknown")
-                msg = decision["message"]
-                # Handle Haiku returning message as array instead of string
-                if isinstance(msg, list):
-                    msg = "\n".join(msg)
-                logger.info(f"Orchestrator sending ({hypothesis}): {msg[:100]}...")
+        if decision.get("should_message") and decision.get("message"):
+            # Check if user started interacting while we were thinking
+            if self.is_user_interacting():
+                logger.info("Orchestrator: user is interacting, skipping send")
+                return
 
-                await self._send_and_record(msg)
-            else:
-                logger.info(f"Orchestrator silent: {decision.get('hypothesis', 'no hypothesis')}")
+            hypothesis = decision.get("hypothesis", "unknown")
+            msg = decision["message"]
+            # Handle Haiku returning message as array instead of string
+            if isinstance(msg, list):
+                msg = "\n".join(msg)
+            logger.info("Orchestrator sending (%s): %.100s...", hypothesis, msg)
 
-        except json.JSONDecodeError:
-            logger.warning(f"Orchestrator returned non-JSON: {text[:100]}")
+            await self._send_and_record(msg)
+        else:
+            logger.info("Orchestrator silent: %s", decision.get('hypothesis', 'no hypothesis'))
 
     async def _send_and_record(self, msg: str) -> None:
         """Send message and record it."""
@@ -640,10 +764,28 @@ FILES TO READ (use read_think_os tool):
         await self.record_proactive_message()
 
     def _get_random_tick_seconds(self) -> int:
-        """Get a random tick interval in seconds."""
+        """Get a random tick interval in seconds, adapted to recent activity.
+
+        Backs off while proactive messages go unanswered (up to 4x) and
+        ticks twice as often while they're stuck. Right after the user talked,
+        the next tick lands just after the RECENT_REPLY_MINUTES window in which
+        _silent_reason skips every tick.
+        """
         min_sec = int(TICK_MIN_MINUTES * 60)
         max_sec = int(TICK_MAX_MINUTES * 60)
-        return random.randint(min_sec, max_sec)
+        seconds = random.randint(min_sec, max_sec)
+
+        state = self.state
+        if state:
+            seconds *= min(1 + state.unanswered_count * 0.5, 4.0)
+            if state.stuck_on:
+                seconds /= 2
+            elif state.last_interaction_ts:
+                quiet_left = state.last_interaction_ts + RECENT_REPLY_MINUTES * 60 - time.time()
+                if quiet_left > 0:
+                    seconds = quiet_left + 1
+
+        return int(min(max(seconds, min_sec), 4 * max_sec))
 
     def _schedule_next_tick(self) -> None:
         """Schedule the next orchestrator tick with a random delay."""
@@ -659,9 +801,9 @@ FILES TO READ (use read_think_os tool):
         )
 
         if TEST_MODE:
-            logger.info(f"Next tick in {delay_seconds}sec")
+            logger.info("Next tick in %dsec", delay_seconds)
         else:
-            logger.info(f"Next tick in {delay_seconds // 60}min")
+            logger.info("Next tick in %dmin", delay_seconds // 60)
 
     async def _tick_and_reschedule(self) -> None:
         """Run orchestrator tick and schedule the next one."""
@@ -673,14 +815,14 @@ FILES TO READ (use read_think_os tool):
         # Fixed schedules
         self.scheduler.add_job(
             self.morning_startup,
-            CronTrigger(hour=8, minute=0),
+            CronTrigger(hour=MORNING_STARTUP_TIME[0], minute=MORNING_STARTUP_TIME[1]),
             id="morning_startup",
             replace_existing=True
         )
 
         self.scheduler.add_job(
             self.evening_wrapup,
-            CronTrigger(hour=21, minute=0),
+            CronTrigger(hour=EVENING_WRAPUP_TIME[0], minute=EVENING_WRAPUP_TIME[1]),
             id="evening_wrapup",
             replace_existing=True
         )
@@ -692,7 +834,7 @@ FILES TO READ (use read_think_os tool):
 
         mode = "TEST MODE" if TEST_MODE else "production"
         tick_range = f"{TICK_MIN_MINUTES}-{TICK_MAX_MINUTES}min"
-        logger.info(f"Scheduler started ({mode}): morning@8am, wrapup@9pm, tick@random({tick_range})")
+        logger.info("Scheduler started (%s): morning@8am, wrapup@9pm, tick@random(%s)", mode, tick_range)
 
     def stop(self) -> None:
         """Stop the scheduler."""
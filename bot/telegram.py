@@ -1,44 +1,88 @@
 import asyncio
+import itertools
 import logging
 import random
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
+from telegram.request import HTTPXRequest
 
-from config.settings import TELEGRAM_BOT_TOKEN, USER_TELEGRAM_ID, ANTHROPIC_API_KEY
-from agent.coach import get_coach
+from config.settings import TELEGRAM_BOT_TOKEN, USER_TELEGRAM_ID, USER_TELEGRAM_ID_INT, ANTHROPIC_API_KEY
 from agent.tools import get_access_summary
 from agent.prompts import get_command, list_commands
 
 logger = logging.getLogger(__name__)
 
+# Users allowed to talk to the bot; None means no restriction. A USER_TELEGRAM_ID
+# that isn't a number gives an empty set, so nobody gets in.
+if not USER_TELEGRAM_ID:
+    _AUTHORIZED_IDS: frozenset[int] | None = None
+elif USER_TELEGRAM_ID_INT is None:
+    _AUTHORIZED_IDS = frozenset()
+else:
+    _AUTHORIZED_IDS = frozenset({USER_TELEGRAM_ID_INT})
+
 # Global scheduler reference (set by main.py)
 _scheduler = None
 
-# Flag to prevent orchestrator from sending while coach is processing
-_user_interacting = False
+# Cleared while the user is talking to the coach, so the orchestrator holds off
+_user_idle = asyncio.Event()
+_user_idle.set()
 
 # Debounce settings
 DEBOUNCE_SECONDS = 4.0  # Wait this long after last message before processing
 
+# Texting-style post-processing: one message per sentence, no trailing . or ,
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_TRIM_CHARS = '.,'
+MERGE_MAX_CHARS = 80  # short sentences on a line are joined up to this length
+MAX_FRAGMENTS = 6  # bubbles per reply; anything past the last one is sent with it
+
+# Humanizing pauses (seconds) between message fragments. Purely cosmetic, so
+# they are drawn once and cycled rather than sampled per fragment.
+_PAUSE_TABLE_SIZE = 1024  # power of two, indexed with a mask
+_REPLY_PAUSES = tuple(random.uniform(0.8, 2.0) for _ in range(_PAUSE_TABLE_SIZE))
+_PROACTIVE_PAUSES = tuple(random.uniform(1.0, 3.0) for _ in range(_PAUSE_TABLE_SIZE))
+_pause_counter = itertools.count()
+
 
-@dataclass
+@dataclass(slots=True)
 class MessageBuffer:
     """Buffer for collecting rapid-fire messages."""
     messages: list = field(default_factory=list)
-    task: asyncio.Task | None = None
+    timer: asyncio.TimerHandle | None = None  # Pending debounce, reset on each message
     chat: any = None  # Store chat for sending responses
 
 
-# Per-user message buffers
-_message_buffers: dict[int, MessageBuffer] = {}
+# Per-user message buffers, least recently used first (capped at MAX_BUFFERS
+# idle ones; buffers with pending messages are never evicted)
+_message_buffers: OrderedDict[int, MessageBuffer] = OrderedDict()
+MAX_BUFFERS = 256
+
+# Processing tasks started by debounce timers (held so they aren't garbage collected)
+_processing_tasks: set[asyncio.Task] = set()
+
+# Updates are handled concurrently, but the coach has one shared history, so
+# its turns run one at a time
+_coach_lock = asyncio.Lock()
+
+
+def reply_pause() -> float:
+    """Pause before the next fragment of a reply."""
+    return _REPLY_PAUSES[next(_pause_counter) & (_PAUSE_TABLE_SIZE - 1)]
+
+
+def proactive_pause() -> float:
+    """Pause between the lines of a proactive message."""
+    return _PROACTIVE_PAUSES[next(_pause_counter) & (_PAUSE_TABLE_SIZE - 1)]
 
 
 def is_user_interacting() -> bool:
     """Check if user is currently interacting (coach processing)."""
-    return _user_interacting
+    return not _user_idle.is_set()
 
 
 def set_scheduler(scheduler) -> None:
@@ -54,16 +98,13 @@ def get_scheduler():
 
 def is_authorized(user_id: int) -> bool:
     """Check if user is authorized to use the bot."""
-    if not USER_TELEGRAM_ID:
-        # No restriction if USER_TELEGRAM_ID not set
-        return True
-    return str(user_id) == str(USER_TELEGRAM_ID)
+    return _AUTHORIZED_IDS is None or user_id in _AUTHORIZED_IDS
 
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /start command."""
     user = update.effective_user
-    logger.info(f"User started bot: id={user.id}, username={user.username}")
+    logger.info("User started bot: id=%s, username=%s", user.id, user.username)
 
     if not is_authorized(user.id):
         await update.message.reply_text("Sorry, this bot is private.")
@@ -103,6 +144,7 @@ async def clear_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         await update.message.reply_text("Sorry, this bot is private.")
         return
 
+    from agent.coach import get_coach
     coach = get_coach()
     history_len = len(coach.history)
     coach.clear_history()
@@ -129,26 +171,45 @@ async def think_os_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         await update.message.reply_text(f"Unknown command: {command_name}")
         return
 
-    logger.info(f"Think OS command: /{command_name}")
+    logger.info("Think OS command: /%s", command_name)
 
     # Send typing indicator
     await update.message.chat.send_action("typing")
 
     try:
+        from agent.coach import get_coach
         coach = get_coach()
-        response = await coach.chat(prompt)
+        async with _coach_lock:
+            response = await coach.chat(prompt)
         await update.message.reply_text(response)
     except Exception as e:
-        logger.error(f"Command error: {e}", exc_info=True)
+        logger.error("Command error: %s", e, exc_info=True)
         await update.message.reply_text(f"Error: {e}")
 
 
+def _split_sentences(line: str) -> list[str]:
+    """Split a line on sentence boundaries (. ! ?), dropping empty or punctuation-only pieces."""
+    return [s for s in map(str.strip, _SENTENCE_SPLIT_RE.split(line.strip())) if s.rstrip(_TRIM_CHARS)]
+
+
+def _coalesce(sentences: list[str]) -> list[str]:
+    """Join consecutive sentences into one message while it stays within
+    MERGE_MAX_CHARS, then strip each message's trailing . and ,"""
+    merged = []
+    for sentence in sentences:
+        if merged and len(merged[-1]) + 1 + len(sentence) <= MERGE_MAX_CHARS:
+            merged[-1] += " " + sentence
+        else:
+            merged.append(sentence)
+    return [m.rstrip(_TRIM_CHARS) for m in merged]
+
+
 async def _process_buffered_messages(user_id: int) -> None:
     """Process all buffered messages for a user after debounce delay."""
-    global _user_interacting
 
     buffer = _message_buffers.get(user_id)
     if not buffer or not buffer.messages:
+        _user_idle.set()  # handle_message cleared it
         return
 
     # Combine all messages into one
@@ -157,70 +218,73 @@ async def _process_buffered_messages(user_id: int) -> None:
     message_count = len(buffer.messages)
 
     # Clear the buffer
-    buffer.messages = []
-    buffer.task = None
+    buffer.messages.clear()
+    buffer.timer = None
 
-    logger.info(f"Processing {message_count} buffered messages for user_id={user_id}")
+    logger.info("Processing %d buffered messages for user_id=%s", message_count, user_id)
 
     # Check for duration in user message and set working deadline
     if _scheduler:
         await _scheduler.check_and_set_working_deadline(combined_text)
 
-    # Set flag to prevent orchestrator from sending
-    _user_interacting = True
+    # Prevent orchestrator from sending
+    _user_idle.clear()
 
     # Send typing indicator
     await chat.send_action("typing")
 
     try:
+        from agent.coach import get_coach
         coach = get_coach()
-        response = await coach.chat(combined_text)
-        if not response or not response.strip():
-            response = "?"  # fallback if empty
 
         # Post-process for texting style (Code > Prompt principle):
         # 1. Split on sentence boundaries to create separate messages
         # 2. Strip trailing . and , (casual style doesn't need them)
         # 3. Keep ? and ! (expressive punctuation)
-        parts = []
-        for line in response.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            # Split on sentence boundaries (. ! ?)
-            sentences = re.split(r'(?<=[.!?])\s+', line)
-            for s in sentences:
-                s = s.strip()
-                if not s:
-                    continue
-                # Strip trailing . and , for casual texting style
-                s = s.rstrip('.,')
-                if s:
-                    parts.append(s)
-
-        for i, part in enumerate(parts):
-            await chat.send_message(part)
-            if i < len(parts) - 1:
-                await chat.send_action("typing")
-                await asyncio.sleep(random.uniform(0.8, 2.0))
+        # 4. Rejoin short sentences on the same line, cap the number of bubbles
+        async with _coach_lock:
+            response = await coach.chat(combined_text)
+
+            fragments = [s for line in response.split("\n") for s in _coalesce(_split_sentences(line))]
+            if len(fragments) > MAX_FRAGMENTS:
+                # The rest goes out together as the last bubble
+                fragments[MAX_FRAGMENTS - 1:] = ["\n".join(fragments[MAX_FRAGMENTS - 1:])]
+
+            for i, fragment in enumerate(fragments):
+                if i:
+                    # Typing indicator goes out during the pause, not before it
+                    await asyncio.gather(
+                        chat.send_action("typing"),
+                        asyncio.sleep(reply_pause()),
+                    )
+                await chat.send_message(fragment)
+
+        if not fragments:
+            await chat.send_message("?")  # fallback if empty
 
         # Record interaction for scheduler
         if _scheduler:
             await _scheduler.record_interaction()
     except Exception as e:
-        logger.error(f"Agent error: {e}", exc_info=True)
+        logger.error("Agent error: %s", e, exc_info=True)
         await chat.send_message(f"Error: {e}")
     finally:
-        _user_interacting = False
+        _user_idle.set()
+
+
+def _start_processing(user_id: int) -> None:
+    """Debounce timer callback: process the user's buffered messages."""
+    task = asyncio.create_task(_process_buffered_messages(user_id))
+    _processing_tasks.add(task)
+    task.add_done_callback(_processing_tasks.discard)
 
 
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle incoming messages with debouncing."""
-    global _user_interacting
     user = update.effective_user
     text = update.message.text
 
-    logger.info(f"Message from user_id={user.id}: {text[:50]}...")
+    logger.info("Message from user_id=%s: %.50s...", user.id, text)
 
     if not is_authorized(user.id):
         await update.message.reply_text("Sorry, this bot is private.")
@@ -233,20 +297,33 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
         return
 
-    # Set flag IMMEDIATELY to prevent orchestrator from sending
-    _user_interacting = True
+    # Block the orchestrator IMMEDIATELY
+    _user_idle.clear()
 
     # Get or create buffer for this user
-    if user.id not in _message_buffers:
-        _message_buffers[user.id] = MessageBuffer()
-
-    buffer = _message_buffers[user.id]
+    buffer = _message_buffers.get(user.id)
+    if buffer is None:
+        if len(_message_buffers) >= MAX_BUFFERS:
+            # Evict the least recently used idle buffer; one with an armed
+            # timer still holds messages waiting to be processed
+            for old_id, old in _message_buffers.items():
+                if old.timer is None:
+                    del _message_buffers[old_id]
+                    break
+        buffer = _message_buffers[user.id] = MessageBuffer()
+    else:
+        _message_buffers.move_to_end(user.id)
     buffer.messages.append(text)
     buffer.chat = update.message.chat
 
-    # Cancel existing debounce task if any
-    if buffer.task and not buffer.task.done():
-        buffer.task.cancel()
+    # Restart the debounce window before any await, so a concurrent update
+    # for the same user can't leave a second timer armed.
+    # The task is only created when the timer fires.
+    if buffer.timer:
+        buffer.timer.cancel()
+    buffer.timer = asyncio.get_running_loop().call_later(
+        DEBOUNCE_SECONDS, _start_processing, user.id
+    )
 
     # Show typing indicator while waiting
     try:
@@ -254,30 +331,34 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     except Exception:
         pass  # Ignore typing indicator errors (topics/permissions)
 
-    # Schedule processing after debounce delay
-    async def debounced_process():
-        await asyncio.sleep(DEBOUNCE_SECONDS)
-        await _process_buffered_messages(user.id)
-
-    buffer.task = asyncio.create_task(debounced_process())
-
 
 def create_application() -> Application:
     """Create and configure the Telegram bot application."""
     if not TELEGRAM_BOT_TOKEN:
         raise ValueError("TELEGRAM_BOT_TOKEN not set")
 
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+    # Separate pools: outgoing sends (replies, typing, proactive messages)
+    # can overlap each other without waiting on the long-polling getUpdates
+    request = HTTPXRequest(connection_pool_size=16, read_timeout=30, write_timeout=30)
+    get_updates_request = HTTPXRequest(connection_pool_size=4)
+
+    application = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .request(request)
+        .get_updates_request(get_updates_request)
+        .concurrent_updates(True)
+        .build()
+    )
 
     # Add handlers
-    application.add_handler(CommandHandler("start", start_command))
-    application.add_handler(CommandHandler("access", access_command))
-    application.add_handler(CommandHandler("clear", clear_command))
-
-    # Think OS commands
-    for cmd in list_commands():
-        application.add_handler(CommandHandler(cmd, think_os_command))
-
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
+    application.add_handlers([
+        CommandHandler("start", start_command),
+        CommandHandler("access", access_command),
+        CommandHandler("clear", clear_command),
+        # Think OS commands - one handler matching any of them
+        CommandHandler(list_commands(), think_os_command),
+        MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message),
+    ])
 
     return application
@@ -10,6 +10,8 @@ load_dotenv(config_dir / ".env")
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 USER_TELEGRAM_ID = os.getenv("USER_TELEGRAM_ID")
+# Parsed once; None if unset or not a number
+USER_TELEGRAM_ID_INT = int(USER_TELEGRAM_ID) if USER_TELEGRAM_ID and USER_TELEGRAM_ID.strip().isdigit() else None
 THINK_OS_PATH = os.getenv("THINK_OS_PATH")
 
 # User personalization
@@ -27,6 +29,13 @@ ORCHESTRATOR_PROVIDER = os.getenv("ORCHESTRATOR_PROVIDER", "anthropic")
 COACH_PROVIDER = os.getenv("COACH_PROVIDER", "anthropic")
 DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
 
+# Coach conversation window - max history messages sent to the model per turn
+SPARK_MAX_HISTORY = int(os.getenv("SPARK_MAX_HISTORY", "40"))
+
+# Orchestrator tool results - max chars per result, and per tick across all results
+ORCHESTRATOR_MAX_TOOL_CHARS = int(os.getenv("ORCHESTRATOR_MAX_TOOL_CHARS", "16000"))
+ORCHESTRATOR_TOOL_BUDGET_CHARS = int(os.getenv("ORCHESTRATOR_TOOL_BUDGET_CHARS", "64000"))
+
 # Test mode: more aggressive nudging, shorter intervals
 TEST_MODE = os.getenv("TEST_MODE", "false").lower() == "true"
 
@@ -5,9 +5,10 @@ import asyncio
 import logging
 import sys
 
-from config.settings import validate_settings, USER_TELEGRAM_ID
-from bot.telegram import create_application, set_scheduler
+from config.settings import validate_settings, USER_TELEGRAM_ID_INT
+from bot.telegram import create_application, set_scheduler, is_user_interacting, proactive_pause
 from bot.scheduler import Scheduler
+from agent.state import flush_state
 
 # Configure logging
 logging.basicConfig(
@@ -22,7 +23,7 @@ def main() -> None:
     # Check required settings
     missing = validate_settings(require_all=True)
     if missing:
-        logger.error(f"Missing required settings: {', '.join(missing)}")
+        logger.error("Missing required settings: %s", ", ".join(missing))
         logger.error("Please create config/.env with required variables")
         sys.exit(1)
 
@@ -35,14 +36,12 @@ def main() -> None:
     async def send_proactive_message(text: str) -> None:
         """Send a proactive message to the user (split on newlines)."""
         import asyncio
-        import random
 
-        if not USER_TELEGRAM_ID:
-            logger.warning("Cannot send proactive message: USER_TELEGRAM_ID not set")
+        chat_id = USER_TELEGRAM_ID_INT
+        if chat_id is None:
+            logger.warning("Cannot send proactive message: USER_TELEGRAM_ID not set or not a number")
             return
 
-        chat_id = int(USER_TELEGRAM_ID)
-
         # Split on newlines - each line is a separate message
         parts = [p.strip() for p in text.split("\n") if p.strip()]
 
@@ -53,17 +52,27 @@ def main() -> None:
                     if i < len(parts) - 1:
                         # Natural delay: show typing, wait 1-3 seconds
                         await application.bot.send_chat_action(chat_id=chat_id, action="typing")
-                        await asyncio.sleep(random.uniform(1.0, 3.0))
-            logger.info(f"Proactive message sent: {text[:50]}...")
+                        await asyncio.sleep(proactive_pause())
+            logger.info("Proactive message sent: %.50s...", text)
         except Exception as e:
-            logger.error(f"Failed to send proactive message: {e}")
+            logger.error("Failed to send proactive message: %s", e)
+
+    # Coach history accessors for the scheduler; the coach module (and its
+    # client) is only loaded once a tick or message actually needs it
+    def get_conversation_history() -> list:
+        from agent.coach import get_coach
+        return get_coach().history
+
+    def add_to_history(msg: dict) -> None:
+        from agent.coach import get_coach
+        get_coach().history.append(msg)
 
     # Create and start scheduler (with access to conversation history)
-    from agent.coach import get_coach
     scheduler = Scheduler(
         send_proactive_message,
-        get_conversation_history=lambda: get_coach().history,
-        add_to_history=lambda msg: get_coach().history.append(msg)
+        get_conversation_history=get_conversation_history,
+        add_to_history=add_to_history,
+        is_user_interacting=is_user_interacting,
     )
     set_scheduler(scheduler)
 
@@ -73,6 +82,7 @@ def main() -> None:
 
     async def on_shutdown(app):
         scheduler.stop()
+        await flush_state()
 
     application.post_init = on_startup
     application.post_shutdown = on_shutdown
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the top-level packages (agent, bot, config) importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,91 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import agent.coach as coach_module
+
+
+class FakeMessages:
+    def __init__(self, text):
+        self.text = text
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(text=self.text)])
+
+
+@pytest.fixture
+def coach(monkeypatch):
+    monkeypatch.setattr(coach_module, "COACH_PROVIDER", "anthropic")
+    monkeypatch.setattr(coach_module, "SPARK_MAX_HISTORY", 4)
+    client = SimpleNamespace(messages=FakeMessages("- user is writing a thesis"))
+    monkeypatch.setattr(coach_module, "get_async_anthropic_client", lambda: client)
+    return coach_module.Coach()
+
+
+def _history(*roles):
+    return [{"role": role, "content": f"{role} {i}"} for i, role in enumerate(roles)]
+
+
+def test_trim_history_under_limit_returns_copy(coach):
+    history = _history("user", "assistant")
+    trimmed = coach._trim_history(history)
+    assert trimmed == history
+    assert trimmed is not history
+
+
+def test_trim_history_starts_window_at_user_message(coach):
+    history = _history("user", "user", "assistant", "assistant", "assistant", "user")
+    # The last 4 start with three assistant messages, which are dropped
+    assert coach._trim_history(history) == [history[5]]
+
+
+def test_trim_history_skips_summarized_messages(coach):
+    coach.history = _history("user", "assistant", "user", "assistant")
+    coach._summarized = 2
+    assert coach._trim_history(coach.history) == coach.history[2:]
+
+
+def test_summary_keeps_history_and_moves_window(coach):
+    coach.history = _history("user", "assistant") * 4
+
+    async def run():
+        coach._schedule_summary()
+        await coach._summary_task
+
+    asyncio.run(run())
+    assert len(coach.history) == 8  # orchestrator still sees the whole day
+    assert coach.rolling_summary == "- user is writing a thesis"
+    assert coach._summarized == 4
+    assert coach._trim_history(coach.history) == coach.history[4:]
+
+    transcript = coach.anthropic_client.messages.calls[0]["messages"][0]["content"]
+    assert "User: user 0" in transcript and "Spark: assistant 1" in transcript
+
+
+def test_summary_cut_lands_before_a_user_message(coach):
+    coach.history = _history("user", "assistant", "assistant", "assistant", "user", "assistant")
+    # Half is 3, an assistant message, so the cut moves on to the user message at 4
+
+    async def run():
+        coach._schedule_summary()
+        await coach._summary_task
+
+    asyncio.run(run())
+    assert coach._summarized == 4
+    assert coach._trim_history(coach.history)[0]["role"] == "user"
+
+
+def test_summary_discarded_when_history_cleared(coach):
+    coach.history = _history("user", "assistant", "user", "assistant")
+
+    async def run():
+        coach._schedule_summary()
+        coach.clear_history()
+        await coach._summary_task
+
+    asyncio.run(run())
+    assert coach.rolling_summary is None
+    assert coach._summarized == 0
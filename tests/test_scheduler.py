@@ -0,0 +1,36 @@
+from bot.scheduler import _extract_decision
+
+
+def test_json_block():
+    text = 'thinking...\n```json\n{"should_message": true, "message": "hey", "hypothesis": "idle"}\n```'
+    assert _extract_decision(text) == {"should_message": True, "message": "hey", "hypothesis": "idle"}
+
+
+def test_bare_object_after_prose():
+    text = 'Read the files. Decision: {"should_message": false, "hypothesis": "deep work"} done'
+    assert _extract_decision(text) == {"should_message": False, "hypothesis": "deep work"}
+
+
+def test_braces_inside_strings():
+    text = '{"should_message": true, "message": "try {this} or }that{", "hypothesis": "a } b"}'
+    assert _extract_decision(text)["message"] == "try {this} or }that{"
+
+
+def test_nested_object_before_key():
+    text = '{"meta": {"n": 1}, "should_message": false}'
+    assert _extract_decision(text) == {"meta": {"n": 1}, "should_message": False}
+
+
+def test_skips_objects_without_should_message():
+    text = 'context {"unanswered": 2} then {"should_message": false}'
+    assert _extract_decision(text) == {"should_message": False}
+
+
+def test_unparsable_candidate_falls_through():
+    text = '{"should_message": tru} oops {"should_message": false}'
+    assert _extract_decision(text) == {"should_message": False}
+
+
+def test_no_decision():
+    assert _extract_decision("no json here") is None
+    assert _extract_decision('{"should_message": ') is None
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+import agent.state as state
+from agent.storage import get_storage
+
+
+@pytest.fixture
+def writes(tmp_path, monkeypatch):
+    """Point state at a temp file, reset the module's caches, record every write."""
+    monkeypatch.setattr(state, "_state_path", str(tmp_path / "memory" / "spark" / "state.json"))
+    monkeypatch.setattr(state, "_pending_state", None)
+    monkeypatch.setattr(state, "_flush_task", None)
+    monkeypatch.setattr(state, "_last_saved", None)
+    monkeypatch.setattr(state, "_loaded", None)
+    monkeypatch.setattr(state, "FLUSH_DELAY_SECONDS", 0.05)
+
+    storage = get_storage()
+    original = storage.write
+    recorded = []
+
+    async def write(path, content):
+        recorded.append(content)
+        await original(path, content)
+
+    monkeypatch.setattr(storage, "write", write)
+    return recorded
+
+
+def test_burst_of_updates_is_written_once(writes):
+    async def run():
+        for i in range(5):
+            latest = await state.update_state(unanswered_count=i)
+        assert writes == []
+        assert latest.unanswered_count == 4
+        await asyncio.sleep(0.15)
+
+    asyncio.run(run())
+    assert len(writes) == 1
+    assert '"unanswered_count": 4' in writes[0]
+
+
+def test_pending_update_is_visible_before_flush(writes):
+    async def run():
+        await state.update_state(stuck_on="taxes")
+        assert (await state.load_state()).stuck_on == "taxes"
+        await state.flush_state()
+
+    asyncio.run(run())
+    assert len(writes) == 1
+
+
+def test_unchanged_state_is_not_rewritten(writes):
+    async def run():
+        await state.update_state(current_focus="thesis")
+        await state.flush_state()
+        await state.update_state(current_focus="thesis")
+        await state.flush_state()
+
+    asyncio.run(run())
+    assert len(writes) == 1
+
+
+def test_flushed_state_reloads_from_disk(writes, monkeypatch):
+    async def run():
+        await state.update_state(working_until="2030-01-01T00:00:00")
+        await state.flush_state()
+        monkeypatch.setattr(state, "_loaded", None)
+        return await state.load_state()
+
+    loaded = asyncio.run(run())
+    assert loaded.working_until == "2030-01-01T00:00:00"
+    assert loaded.working_until_ts == state._iso_to_ts("2030-01-01T00:00:00")
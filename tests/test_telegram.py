@@ -0,0 +1,28 @@
+from bot.telegram import MERGE_MAX_CHARS, _coalesce, _split_sentences
+
+
+def test_split_on_sentence_boundaries():
+    assert _split_sentences("hey there. how's it going? good!") == ["hey there.", "how's it going?", "good!"]
+
+
+def test_split_keeps_decimals_together():
+    assert _split_sentences("took 3.5 hours. nice") == ["took 3.5 hours.", "nice"]
+
+
+def test_split_drops_empty_and_punctuation_only_pieces():
+    assert _split_sentences("   ") == []
+    assert _split_sentences("ok. . ,") == ["ok."]
+
+
+def test_coalesce_joins_short_sentences_and_strips_trailing_punctuation():
+    assert _coalesce(["hey there.", "how's it going?", "good!"]) == ["hey there. how's it going? good!"]
+    assert _coalesce(["done.", "nice,"]) == ["done. nice"]
+
+
+def test_coalesce_respects_merge_limit():
+    long = "x" * (MERGE_MAX_CHARS - 2) + "."
+    assert _coalesce(["hi.", long, "ok."]) == ["hi", long.rstrip("."), "ok"]
+
+
+def test_coalesce_empty():
+    assert _coalesce([]) == []
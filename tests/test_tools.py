@@ -0,0 +1,45 @@
+import itertools
+from pathlib import PurePath
+
+from agent.tools import (
+    READABLE_PATHS, WRITABLE_PATHS, BLOCKED_PATHS,
+    _READABLE_TRIE, _WRITABLE_TRIE, _BLOCKED_TRIE, _PatternTrie,
+)
+
+# Segments that hit every rule: literals, * and ** globs, suffix globs, dot entries
+SEGMENTS = [
+    "now.md", "memory", "spark", "x.md", "a.json", "timeline", "daily", "todo", "people",
+    "perspective.md", "tinker", "p", "q.md", "private", ".git", "config", "y.secret.md", "", "..", ".",
+]
+
+
+def _paths():
+    for n in range(1, 5):
+        for combo in itertools.product(SEGMENTS, repeat=n):
+            yield "/".join(combo)
+
+
+def test_trie_matches_purepath_match():
+    rules = [(READABLE_PATHS, _READABLE_TRIE), (WRITABLE_PATHS, _WRITABLE_TRIE), (BLOCKED_PATHS, _BLOCKED_TRIE)]
+    mismatches = []
+    for path in _paths():
+        pure = PurePath(path)
+        segments = pure.as_posix().split("/")
+        for patterns, trie in rules:
+            expected = any(pure.match(p) for p in patterns)
+            if trie.match(segments) != expected:
+                mismatches.append((path, patterns[0], expected))
+    assert mismatches == []
+
+
+def test_relative_pattern_matches_at_any_depth():
+    trie = _PatternTrie(["*.secret.md"])
+    assert trie.match(["a.secret.md"])
+    assert trie.match(["memory", "people", "a.secret.md"])
+    assert not trie.match(["memory", "a.md"])
+
+
+def test_glob_does_not_cross_segments():
+    trie = _PatternTrie(["memory/*.md"])
+    assert trie.match(["memory", "x.md"])
+    assert not trie.match(["memory", "spark", "x.md"])